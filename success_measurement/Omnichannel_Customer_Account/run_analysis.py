@@ -7,12 +7,18 @@ Usage:
     python3 run_analysis.py all          # Fetch data + calculate metrics + generate dashboard
     python3 run_analysis.py fetch_data   # Only fetch GitHub and Jira data
     python3 run_analysis.py metrics      # Only calculate metrics and generate dashboard
+    python3 run_analysis.py fetch_data --full-refresh   # Re-download all Jira issues
 """
 
-import argparse
+import hashlib
+import json
 import logging
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add parent directory to path to import shared modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,21 +27,418 @@ from shared.utils import (
     setup_logging,
     load_env_vars,
     load_yaml_config,
-    write_to_csv,
+    CSVStreamWriter,
+    format_date_for_jira,
     ensure_data_directory,
     load_csv_to_dict,
+    iter_csv_as_dicts,
     csv_exists
 )
-from shared.github_client import GitHubClient
-from shared.jira_client import JiraClient
-from shared.metrics_calculator import calculate_all_metrics
-from shared.dashboard_generator import generate_html_dashboard
 
+# Project paths, resolved once (string forms are what the shared helpers take)
+PROJECT_DIR = Path(__file__).parent
+DATA_DIR = PROJECT_DIR / 'data'
+CONFIG_PATH = str(PROJECT_DIR / 'config.yaml')
+GITHUB_CSV = str(DATA_DIR / 'github_data.csv')
+JIRA_CSV = str(DATA_DIR / 'jira_data.csv')
+DASHBOARD_PATH = str(DATA_DIR / 'metrics_dashboard.html')
+HTTP_CACHE_DIR = str(DATA_DIR / '.http_cache')
+JIRA_LAST_RUN_PATH = DATA_DIR / '.jira_last_run.json'
 
-def main():
-    """Main execution function."""
+# Overlap between incremental Jira fetches (JQL dates are day-granular and in the user's time zone)
+JIRA_INCREMENTAL_OVERLAP = timedelta(days=1)
+
+# Upper bound on repositories fetched in parallel; GitHubClient separately caps the requests
+# in flight across all repositories and PR workers to its connection pool size
+MAX_REPO_WORKERS = 10
+
+GITHUB_FIELDNAMES = [
+    'repository',
+    'pr_name',
+    'pr_number',
+    'created_at',
+    'merged_at',
+    'is_merged',
+    'num_comments',
+    'num_commits',
+    'num_files_changed'
+]
+
+BANNER_RULE = "=" * 60
+
+EXECUTION_MODES = ('all', 'fetch_data', 'metrics')
+
+JIRA_FIELDNAMES = [
+    'ticket_key',
+    'summary',
+    'type',
+    'created',
+    'in_progress_timestamp',
+    'done_timestamp'
+]
+
+
+def format_banner(*lines: str, leading_newline: bool = True) -> str:
+    """
+    Build a section banner as a single multi-line string, so it is logged in one call.
+    
+    Args:
+        lines: Title lines shown between the rules.
+        leading_newline: Whether to start with a blank line separating it from prior output.
+        
+    Returns:
+        Banner text.
+    """
+    banner = "\n".join([BANNER_RULE, *lines, BANNER_RULE])
+    return "\n" + banner if leading_newline else banner
+
+
+def fetch_github_phase(env_vars: Dict[str, str], repositories: List[Dict[str, str]],
+                       date_range_months: int) -> None:
+    """
+    Fetch PR data for all configured repositories and write github_data.csv.
+    
+    Args:
+        env_vars: Validated environment variables.
+        repositories: Repository configurations from config.yaml.
+        date_range_months: Number of months to look back for data.
+        
+    Repositories that fail are reported and skipped; data from the others is still written.
+    
+    Raises:
+        SystemExit: If the client cannot be created, every repository fails or the CSV cannot be written.
+    """
+    # Imported here so metrics-only runs never load the HTTP client stack
+    from shared.github_client import GitHubClient
+    
+    try:
+        github_client = GitHubClient(
+            token=env_vars['GITHUB_TOKEN'],
+            organization=env_vars['GITHUB_ORG'],
+            date_range_months=date_range_months,
+            cache_dir=HTTP_CACHE_DIR
+        )
+    except Exception as e:
+        logging.error(f"Failed to initialize GitHub client: {e}")
+        sys.exit(1)
+    
+    # Fetch GitHub data for all repositories concurrently (each repo is independent)
+    failed_repos = []
+    
+    with CSVStreamWriter(GITHUB_CSV, GITHUB_FIELDNAMES) as github_writer:
+        if repositories:
+            max_workers = min(len(repositories), MAX_REPO_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                repo_futures = deque(
+                    (repo_config, executor.submit(github_client.fetch_all_pr_data, repo_config))
+                    for repo_config in repositories
+                )
+                
+                # Write each repository as soon as its fetch completes, in config order so the
+                # CSV row order stays stable between runs; popping releases the rows once written
+                while repo_futures:
+                    repo_config, future = repo_futures.popleft()
+                    try:
+                        repo_rows = future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to fetch GitHub data for {repo_config['repository']}: {e}")
+                        failed_repos.append(repo_config['repository'])
+                        continue
+                    
+                    github_writer.writerows(repo_rows)
+    
+    if not github_writer.count:
+        logging.warning("No GitHub data found in the specified date range.")
+    
+    # Data from healthy repositories is kept; the phase only fails if nothing could be fetched
+    if failed_repos:
+        logging.error(f"GitHub data could not be fetched for: {', '.join(failed_repos)}")
+        if len(failed_repos) == len(repositories):
+            sys.exit(1)
+        logging.warning("Continuing with data from the remaining repositories.")
+
+
+def jira_statuses_hash(config: Dict[str, Any]) -> str:
+    """
+    Fingerprint the status mapping that Jira rows are built from.
+    
+    The cached jira_data.csv holds timestamps derived from config['statuses'], so a
+    changed mapping must not be merged with rows computed under the old one.
+    
+    Args:
+        config: Full project configuration.
+        
+    Returns:
+        Stable hex digest of the 'statuses' section.
+    """
+    statuses = json.dumps(config.get('statuses', {}), sort_keys=True)
+    return hashlib.sha256(statuses.encode('utf-8')).hexdigest()
+
+
+def load_jira_last_run(project_key: str, date_range_months: int, statuses_hash: str) -> Optional[datetime]:
+    """
+    Read the time of the last successful Jira fetch.
+    
+    Args:
+        project_key: Jira project key the previous run must match.
+        date_range_months: Date range the previous run must match.
+        statuses_hash: jira_statuses_hash() of the current config the previous run must match.
+        
+    Returns:
+        Start time of the last successful fetch, or None if there is no usable record
+        (missing, unreadable, or recorded for a different project/date range/status mapping).
+    """
+    try:
+        with open(JIRA_LAST_RUN_PATH, 'r', encoding='utf-8') as f:
+            last_run = json.load(f)
+        if (last_run.get('project_key') != project_key or
+                last_run.get('date_range_months') != date_range_months or
+                last_run.get('statuses_hash') != statuses_hash):
+            return None
+        return datetime.fromisoformat(last_run['last_run'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_jira_last_run(project_key: str, date_range_months: int, statuses_hash: str,
+                       started_at: datetime) -> None:
+    """
+    Record a successful Jira fetch so the next run can fetch only what changed.
+    
+    Args:
+        project_key: Jira project key that was fetched.
+        date_range_months: Date range that was fetched.
+        statuses_hash: jira_statuses_hash() of the config the rows were built with.
+        started_at: Time the fetch started.
+    """
+    last_run = {
+        'project_key': project_key,
+        'date_range_months': date_range_months,
+        'statuses_hash': statuses_hash,
+        'last_run': started_at.isoformat(timespec='seconds')
+    }
+    try:
+        with open(JIRA_LAST_RUN_PATH, 'w', encoding='utf-8') as f:
+            json.dump(last_run, f)
+    except OSError as e:
+        logging.warning(f"Could not record Jira fetch time (next run will be a full refresh): {e}")
+
+
+def fetch_jira_phase(env_vars: Dict[str, str], project_key: str, config: Dict[str, Any],
+                     date_range_months: int, full_refresh: bool = False) -> None:
+    """
+    Fetch issue data for the configured Jira project and write jira_data.csv.
+    
+    After a successful run, later runs only fetch issues updated since then and
+    merge them into the existing CSV (unless full_refresh is set).
+    
+    Args:
+        env_vars: Validated environment variables.
+        project_key: Jira project key.
+        config: Full project configuration.
+        date_range_months: Number of months to look back for data.
+        full_refresh: Ignore the previous run and re-download every issue.
+        
+    Raises:
+        SystemExit: If the client cannot be created, the fetch fails or the CSV cannot be written.
+    """
+    from shared.jira_client import JiraClient
+    
+    try:
+        jira_client = JiraClient(
+            email=env_vars['ATLASSIAN_EMAIL'],
+            api_token=env_vars['ATLASSIAN_API_TOKEN'],
+            base_url=env_vars['ATLASSIAN_BASE_URL'],
+            date_range_months=date_range_months
+        )
+    except Exception as e:
+        logging.error(f"Failed to initialize Jira client: {e}")
+        sys.exit(1)
+    
+    started_at = datetime.now()
+    statuses_hash = jira_statuses_hash(config)
+    
+    # Incremental refresh: keep previously fetched issues still inside the window
+    # and only ask Jira for issues updated since the last successful run
+    updated_since = None
+    previous_rows = {}
+    last_run = None if full_refresh else load_jira_last_run(project_key, date_range_months, statuses_hash)
+    if last_run and csv_exists(JIRA_CSV):
+        window_start = format_date_for_jira(jira_client.get_window_start())
+        previous_rows = {
+            row['ticket_key']: row
+            for row in iter_csv_as_dicts(JIRA_CSV)
+            if row.get('created', '') >= window_start
+        }
+        updated_since = last_run - JIRA_INCREMENTAL_OVERLAP
+        logging.warning(f"Incremental Jira refresh: {len(previous_rows)} issues already cached "
+                        f"(use --full-refresh to re-download everything)")
+    
+    # Fetch Jira data, writing each issue to the CSV as it is processed
+    with jira_client, CSVStreamWriter(JIRA_CSV, JIRA_FIELDNAMES) as jira_writer:
+        try:
+            for row in jira_client.iter_jira_data(project_key, config, updated_since):
+                previous_rows.pop(row['ticket_key'], None)
+                jira_writer.writerow(row)
+        except Exception as e:
+            logging.error(f"Failed to fetch Jira data: {e}")
+            sys.exit(1)
+        
+        # Issues that have not changed since the last run
+        jira_writer.writerows(previous_rows.values())
+    
+    if not jira_writer.count:
+        logging.warning("No Jira data found in the specified date range.")
+    else:
+        save_jira_last_run(project_key, date_range_months, statuses_hash, started_at)
+
+
+def run_data_collection(config: Dict[str, Any], full_refresh: bool = False) -> None:
+    """
+    Fetch GitHub and Jira data concurrently and write both CSV files.
+    
+    Args:
+        config: Full project configuration.
+        full_refresh: Re-download all Jira issues instead of only those changed since the last run.
+        
+    Raises:
+        SystemExit: If credentials are missing or either phase fails.
+    """
+    project_key = config.get('project_key')
+    repositories = config.get('repositories', [])
+    date_range_months = config.get('date_range_months', 12)
+    
+    # Load environment variables (only needed for data fetching)
+    logging.warning("\nLoading environment variables...")
+    try:
+        env_vars = load_env_vars()
+    except SystemExit:
+        logging.error("Failed to load environment variables. Aborting.")
+        sys.exit(1)
+    
+    # GitHub and Jira are independent, I/O-bound services: fetch both at once
+    logging.warning(format_banner("PHASE 1 & 2: FETCHING GITHUB AND JIRA DATA (CONCURRENTLY)"))
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        phase_futures = {
+            'GitHub': executor.submit(
+                fetch_github_phase, env_vars, repositories, date_range_months
+            ),
+            'Jira': executor.submit(
+                fetch_jira_phase, env_vars, project_key, config, date_range_months, full_refresh
+            ),
+        }
+    
+    # Collect per-phase outcomes so one failing service does not hide the other's result
+    failed_phases = []
+    for phase_name, future in phase_futures.items():
+        try:
+            future.result()
+        except SystemExit:
+            # Error details were already logged inside the phase
+            failed_phases.append(phase_name)
+        except Exception as e:
+            logging.error(f"{phase_name} data collection failed: {e}")
+            failed_phases.append(phase_name)
+    
+    if failed_phases:
+        logging.error(f"Data collection failed for: {', '.join(failed_phases)}. Aborting.")
+        sys.exit(1)
+    
+    logging.warning(format_banner("DATA COLLECTION COMPLETED SUCCESSFULLY"))
+
+
+def run_metrics(config: Dict[str, Any]) -> None:
+    """
+    Calculate metrics from the existing CSV files and generate the HTML dashboard.
+    
+    Args:
+        config: Full project configuration.
+        
+    Raises:
+        SystemExit: If CSV files are missing or metrics/dashboard generation fails.
+    """
+    # Imported here so fetch-only runs skip loading the metrics and dashboard modules
+    from shared.metrics_calculator import calculate_all_metrics
+    from shared.dashboard_generator import generate_html_dashboard
+    
+    logging.warning(format_banner("PHASE 3: CALCULATING METRICS"))
+    
+    # Check if CSV files exist
+    if not csv_exists(GITHUB_CSV):
+        logging.error(f"GitHub CSV not found: {GITHUB_CSV}")
+        logging.error("Please run data collection first: python3 run_analysis.py fetch_data")
+        sys.exit(1)
+    
+    if not csv_exists(JIRA_CSV):
+        logging.error(f"Jira CSV not found: {JIRA_CSV}")
+        logging.error("Please run data collection first: python3 run_analysis.py fetch_data")
+        sys.exit(1)
+    
+    # Load CSV data (Jira is used by several metrics; GitHub rows are streamed in one pass)
+    logging.warning("Loading existing CSV data...")
+    jira_data = load_csv_to_dict(JIRA_CSV)
+    github_data = iter_csv_as_dicts(GITHUB_CSV)
+    
+    # Calculate metrics
+    logging.warning("Calculating metrics...")
+    try:
+        metrics_results = calculate_all_metrics(jira_data, github_data, config)
+    except Exception as e:
+        logging.error(f"Failed to calculate metrics: {e}")
+        sys.exit(1)
+    
+    # Generate HTML dashboard
+    logging.warning(format_banner("PHASE 4: GENERATING HTML DASHBOARD"))
+    
+    try:
+        generate_html_dashboard(metrics_results, DASHBOARD_PATH)
+        logging.warning(f"Dashboard saved to: {DASHBOARD_PATH}")
+    except Exception as e:
+        logging.error(f"Failed to generate dashboard: {e}")
+        sys.exit(1)
+    
+    # Print metrics summary (built up and logged as one message)
+    summary_lines = [format_banner("METRICS SUMMARY")]
+    
+    if 'change_lead_time' in metrics_results:
+        clt = metrics_results['change_lead_time']
+        summary_lines.append(f"Change Lead Time (Median): {clt.get('median_days', 0):.1f} days")
+        summary_lines.append(f"  Based on {clt.get('matched_pr_count', 0)} matched PRs")
+    
+    if 'cycle_time' in metrics_results:
+        ct = metrics_results['cycle_time']
+        summary_lines.append(f"Cycle Time (Median): {ct.get('median_days', 0):.1f} days")
+        summary_lines.append(f"  Based on {ct.get('completed_count', 0)} completed issues")
+    
+    if 'bug_resolution_time' in metrics_results:
+        brt = metrics_results['bug_resolution_time']
+        summary_lines.append(f"Bug Resolution Time (Median): {brt.get('median_days', 0):.1f} days")
+        summary_lines.append(f"  Based on {brt.get('completed_count', 0)} completed bugs")
+    
+    summary_lines.append(f"\nDashboard: {DASHBOARD_PATH}")
+    summary_lines.append(format_banner("METRICS GENERATION COMPLETED SUCCESSFULLY"))
+    logging.warning("\n".join(summary_lines))
+
+
+def parse_cli_args() -> Tuple[str, bool]:
+    """
+    Determine the execution mode and options from the command line.
+    
+    The common invocations (no argument, or a single valid mode) are resolved
+    directly; argparse is only built for anything else (options, help, invalid input).
+    
+    Returns:
+        Tuple of (mode, full_refresh) where mode is 'all', 'fetch_data' or 'metrics'.
+    """
+    cli_args = sys.argv[1:]
+    if not cli_args:
+        return 'all', False
+    if len(cli_args) == 1 and cli_args[0] in EXECUTION_MODES:
+        return cli_args[0], False
+    
+    import argparse
     
-    # Parse command-line arguments
     parser = argparse.ArgumentParser(
         description='Success Measurement Analysis Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -44,42 +447,51 @@ Examples:
   python3 run_analysis.py all          # Full execution (default)
   python3 run_analysis.py fetch_data   # Only fetch data from APIs
   python3 run_analysis.py metrics      # Only calculate metrics from existing CSVs
+  python3 run_analysis.py fetch_data --full-refresh   # Re-download all Jira issues
         """
     )
     parser.add_argument(
         'mode',
         nargs='?',
         default='all',
-        choices=['all', 'fetch_data', 'metrics'],
+        choices=EXECUTION_MODES,
         help='Execution mode (default: all)'
     )
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Re-download all Jira issues instead of only those updated since the last run'
+    )
     
     args = parser.parse_args()
-    mode = args.mode
+    return args.mode, args.full_refresh
+
+
+def main():
+    """Main execution function."""
+    
+    mode, full_refresh = parse_cli_args()
     
     # Setup logging (minimal - WARNING/ERROR only)
     setup_logging()
     
-    logging.warning("=" * 60)
-    logging.warning("SUCCESS MEASUREMENT - DATA COLLECTION & METRICS")
-    logging.warning("Project: Omnichannel Customer Account")
-    logging.warning(f"Execution Mode: {mode.upper()}")
-    logging.warning("=" * 60)
-    
-    # Get the project directory
-    project_dir = Path(__file__).parent
+    logging.warning(format_banner(
+        "SUCCESS MEASUREMENT - DATA COLLECTION & METRICS",
+        "Project: Omnichannel Customer Account",
+        f"Execution Mode: {mode.upper()}",
+        leading_newline=False
+    ))
     
     # Load project configuration (always needed)
-    config_path = project_dir / 'config.yaml'
-    logging.warning(f"Loading configuration from {config_path}...")
+    logging.warning(f"Loading configuration from {CONFIG_PATH}...")
     try:
-        config = load_yaml_config(str(config_path))
+        config = load_yaml_config(CONFIG_PATH)
     except SystemExit:
         logging.error("Failed to load configuration. Aborting.")
         sys.exit(1)
     
     # Ensure data directory exists
-    ensure_data_directory(str(project_dir))
+    ensure_data_directory(str(PROJECT_DIR))
     
     # Extract configuration
     project_name = config.get('project_name', 'Unknown')
@@ -87,195 +499,26 @@ Examples:
     repositories = config.get('repositories', [])
     date_range_months = config.get('date_range_months', 12)
     
-    logging.warning(f"Project: {project_name}")
-    logging.warning(f"Date Range: Last {date_range_months} months")
-    logging.warning(f"Repositories: {len(repositories)}")
-    logging.warning(f"Jira Project Key: {project_key}")
+    logging.warning(
+        f"Project: {project_name}\n"
+        f"Date Range: Last {date_range_months} months\n"
+        f"Repositories: {len(repositories)}\n"
+        f"Jira Project Key: {project_key}"
+    )
     
     # ==========================================================================
     # DATA FETCHING PHASE (modes: 'all' or 'fetch_data')
     # ==========================================================================
     
     if mode in ['all', 'fetch_data']:
-        # Load environment variables (only needed for data fetching)
-        logging.warning("\nLoading environment variables...")
-        try:
-            env_vars = load_env_vars()
-        except SystemExit:
-            logging.error("Failed to load environment variables. Aborting.")
-            sys.exit(1)
-        
-        # Initialize GitHub client
-        logging.warning("\n" + "=" * 60)
-        logging.warning("PHASE 1: FETCHING GITHUB DATA")
-        logging.warning("=" * 60)
-        
-        try:
-            github_client = GitHubClient(
-                token=env_vars['GITHUB_TOKEN'],
-                organization=env_vars['GITHUB_ORG'],
-                date_range_months=date_range_months
-            )
-        except Exception as e:
-            logging.error(f"Failed to initialize GitHub client: {e}")
-            sys.exit(1)
-        
-        # Fetch GitHub data for all repositories
-        all_github_data = []
-        
-        for repo_config in repositories:
-            try:
-                repo_data = github_client.fetch_all_pr_data(repo_config)
-                all_github_data.extend(repo_data)
-            except Exception as e:
-                logging.error(f"Failed to fetch GitHub data for {repo_config['repository']}: {e}")
-                sys.exit(1)
-        
-        # Write GitHub data to CSV
-        if all_github_data:
-            github_csv_path = project_dir / 'data' / 'github_data.csv'
-            github_fieldnames = [
-                'repository',
-                'pr_name',
-                'pr_number',
-                'created_at',
-                'merged_at',
-                'is_merged',
-                'num_comments',
-                'num_commits',
-                'num_files_changed'
-            ]
-            
-            try:
-                write_to_csv(all_github_data, str(github_csv_path), github_fieldnames)
-            except SystemExit:
-                logging.error("Failed to write GitHub CSV. Aborting.")
-                sys.exit(1)
-        else:
-            logging.warning("No GitHub data found in the specified date range.")
-        
-        # Initialize Jira client
-        logging.warning("\n" + "=" * 60)
-        logging.warning("PHASE 2: FETCHING JIRA DATA")
-        logging.warning("=" * 60)
-        
-        try:
-            jira_client = JiraClient(
-                email=env_vars['ATLASSIAN_EMAIL'],
-                api_token=env_vars['ATLASSIAN_API_TOKEN'],
-                base_url=env_vars['ATLASSIAN_BASE_URL'],
-                date_range_months=date_range_months
-            )
-        except Exception as e:
-            logging.error(f"Failed to initialize Jira client: {e}")
-            sys.exit(1)
-        
-        # Fetch Jira data
-        try:
-            jira_data = jira_client.fetch_all_jira_data(project_key, config)
-        except Exception as e:
-            logging.error(f"Failed to fetch Jira data: {e}")
-            sys.exit(1)
-        
-        # Write Jira data to CSV
-        if jira_data:
-            jira_csv_path = project_dir / 'data' / 'jira_data.csv'
-            jira_fieldnames = [
-                'ticket_key',
-                'summary',
-                'type',
-                'created',
-                'in_progress_timestamp',
-                'done_timestamp'
-            ]
-            
-            try:
-                write_to_csv(jira_data, str(jira_csv_path), jira_fieldnames)
-            except SystemExit:
-                logging.error("Failed to write Jira CSV. Aborting.")
-                sys.exit(1)
-        else:
-            logging.warning("No Jira data found in the specified date range.")
-        
-        logging.warning("\n" + "=" * 60)
-        logging.warning("DATA COLLECTION COMPLETED SUCCESSFULLY")
-        logging.warning("=" * 60)
+        run_data_collection(config, full_refresh)
     
     # ==========================================================================
     # METRICS CALCULATION PHASE (modes: 'all' or 'metrics')
     # ==========================================================================
     
     if mode in ['all', 'metrics']:
-        logging.warning("\n" + "=" * 60)
-        logging.warning("PHASE 3: CALCULATING METRICS")
-        logging.warning("=" * 60)
-        
-        # Define CSV paths
-        github_csv_path = project_dir / 'data' / 'github_data.csv'
-        jira_csv_path = project_dir / 'data' / 'jira_data.csv'
-        
-        # Check if CSV files exist
-        if not csv_exists(str(github_csv_path)):
-            logging.error(f"GitHub CSV not found: {github_csv_path}")
-            logging.error("Please run data collection first: python3 run_analysis.py fetch_data")
-            sys.exit(1)
-        
-        if not csv_exists(str(jira_csv_path)):
-            logging.error(f"Jira CSV not found: {jira_csv_path}")
-            logging.error("Please run data collection first: python3 run_analysis.py fetch_data")
-            sys.exit(1)
-        
-        # Load CSV data
-        logging.warning("Loading existing CSV data...")
-        github_data = load_csv_to_dict(str(github_csv_path))
-        jira_data = load_csv_to_dict(str(jira_csv_path))
-        
-        # Calculate metrics
-        logging.warning("Calculating metrics...")
-        try:
-            metrics_results = calculate_all_metrics(jira_data, github_data, config)
-        except Exception as e:
-            logging.error(f"Failed to calculate metrics: {e}")
-            sys.exit(1)
-        
-        # Generate HTML dashboard
-        logging.warning("\n" + "=" * 60)
-        logging.warning("PHASE 4: GENERATING HTML DASHBOARD")
-        logging.warning("=" * 60)
-        
-        dashboard_path = project_dir / 'data' / 'metrics_dashboard.html'
-        
-        try:
-            generate_html_dashboard(metrics_results, str(dashboard_path))
-            logging.warning(f"Dashboard saved to: {dashboard_path}")
-        except Exception as e:
-            logging.error(f"Failed to generate dashboard: {e}")
-            sys.exit(1)
-        
-        # Print metrics summary
-        logging.warning("\n" + "=" * 60)
-        logging.warning("METRICS SUMMARY")
-        logging.warning("=" * 60)
-        
-        if 'change_lead_time' in metrics_results:
-            clt = metrics_results['change_lead_time']
-            logging.warning(f"Change Lead Time (Median): {clt.get('median_days', 0):.1f} days")
-            logging.warning(f"  Based on {clt.get('matched_pr_count', 0)} matched PRs")
-        
-        if 'cycle_time' in metrics_results:
-            ct = metrics_results['cycle_time']
-            logging.warning(f"Cycle Time (Median): {ct.get('median_days', 0):.1f} days")
-            logging.warning(f"  Based on {ct.get('completed_count', 0)} completed issues")
-        
-        if 'bug_resolution_time' in metrics_results:
-            brt = metrics_results['bug_resolution_time']
-            logging.warning(f"Bug Resolution Time (Median): {brt.get('median_days', 0):.1f} days")
-            logging.warning(f"  Based on {brt.get('completed_count', 0)} completed bugs")
-        
-        logging.warning(f"\nDashboard: {dashboard_path}")
-        logging.warning("\n" + "=" * 60)
-        logging.warning("METRICS GENERATION COMPLETED SUCCESSFULLY")
-        logging.warning("=" * 60)
+        run_metrics(config)
     
     sys.exit(0)
 
@@ -3,21 +3,68 @@ GitHub API client for fetching pull request data.
 """
 
 import logging
-import sys
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    RetryError, retry, stop_after_attempt, wait_exponential, retry_if_exception_type, retry_if_exception
+)
 
-from .utils import format_timestamp_for_csv, format_date_for_github, calculate_date_range
+from .http_cache import HttpCache
+from .utils import format_timestamp_for_csv, format_date_for_github, calculate_date_range, parse_json_response
+
+
+# Attempts per request while GitHub answers with a rate limit; the last one is raised as GitHubAPIError
+_MAX_RATE_LIMITED_ATTEMPTS = 5
+
+# Connections kept per host, and the cap on requests in flight across all repository and
+# PR workers (repository fetches run in parallel and each fetches its PRs in parallel)
+_POOL_MAXSIZE = 32
+
+# Wait used when a rate-limited response says neither Retry-After nor X-RateLimit-Reset
+_DEFAULT_RATE_LIMIT_WAIT = 60
+
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API returns an error response."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """
+    Return True for rate-limit responses: 429, and the 403 GitHub sends for its secondary
+    (abuse) rate limit (with Retry-After) or an exhausted primary limit.
+    """
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and (
+        'Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0'
+    )
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Return True for failures worth retrying: network errors and GitHub 5xx responses."""
+    if isinstance(error, RetryError):
+        # Request-level retries gave up; judge by the error that caused them
+        error = error.last_attempt.exception()
+    if isinstance(error, GitHubAPIError):
+        return error.status_code is not None and error.status_code >= 500
+    return isinstance(error, requests.exceptions.RequestException)
 
 
 class GitHubClient:
     """Client for interacting with GitHub REST API."""
     
-    def __init__(self, token: str, organization: str, date_range_months: int = 12):
+    def __init__(self, token: str, organization: str, date_range_months: int = 12,
+                 cache_dir: Optional[str] = None, max_workers: int = 8,
+                 fetch_details_for_unmerged: bool = False):
         """
         Initialize GitHub client.
         
@@ -25,6 +72,12 @@ class GitHubClient:
             token: GitHub personal access token.
             organization: GitHub organization name.
             date_range_months: Number of months to look back for data.
+            cache_dir: Optional directory for the ETag response cache. When set,
+                repeat requests are revalidated with If-None-Match.
+            max_workers: Number of PRs per repository whose details are fetched in parallel.
+            fetch_details_for_unmerged: Also fetch comment, commit and file counts for PRs
+                that are not merged. Off by default since the metrics only use merged PRs;
+                the counts of unmerged PRs are then written as 0.
         """
         self.token = token
         self.organization = organization
@@ -33,10 +86,95 @@ class GitHubClient:
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.max_workers = max_workers
+        self.fetch_details_for_unmerged = fetch_details_for_unmerged
+        
+        # One session shared by all worker threads (reuses connections)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # The default pool keeps 10 connections per host; repositories and their PR
+        # workers run concurrently, so keep more alive instead of discarding them
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=_POOL_MAXSIZE, max_retries=0))
+        # Shared by every worker thread, so nested repository/PR parallelism never has more
+        # requests in flight than the pool has connections
+        self._request_slots = threading.BoundedSemaphore(_POOL_MAXSIZE)
+        
+        # Only one worker sleeps off a rate limit; the others wait on the lock
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_waited_reset = 0
         
         # Calculate date range
         self.since_date = calculate_date_range(date_range_months)
         self.since_date_str = format_date_for_github(self.since_date)
+        # Window start in GitHub's UTC timestamp format; such strings sort chronologically
+        self._since_timestamp = self.since_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        self.http_cache = HttpCache(cache_dir) if cache_dir else None
+        
+        # API URL prefix per repository, built on first use
+        self._repo_urls = {}
+    
+    def _repo_url(self, repo: str) -> str:
+        """
+        Get the API URL prefix for a repository.
+        
+        Args:
+            repo: Repository name.
+            
+        Returns:
+            URL of the form https://api.github.com/repos/{org}/{repo}.
+        """
+        url = self._repo_urls.get(repo)
+        if url is None:
+            url = self._repo_urls[repo] = f"{self.base_url}/repos/{self.organization}/{repo}"
+        return url
+    
+    def _respect_rate_limit(self, response: requests.Response) -> None:
+        """
+        Sleep until the rate limit resets when a response reports it is nearly used up.
+        
+        Only one worker sleeps per reset window; the others wait on the lock.
+        
+        Args:
+            response: Response whose X-RateLimit headers are checked.
+        """
+        remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
+        if remaining >= 10:
+            return
+        
+        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        with self._rate_limit_lock:
+            # Skip if another worker already waited for this reset window
+            if reset_time > self._rate_limit_waited_reset:
+                wait_time = max(reset_time - time.time(), 0) + 5
+                logging.warning(f"GitHub rate limit low ({remaining} remaining). Waiting {wait_time}s...")
+                time.sleep(wait_time)
+                self._rate_limit_waited_reset = reset_time
+    
+    def _wait_for_rate_limit(self, response: requests.Response) -> None:
+        """
+        Sleep off a rate-limited response while holding the rate limit lock.
+        
+        Other workers block on the lock before their next request, so nobody keeps
+        hitting GitHub during the wait. Workers that were rate limited at the same time
+        only sleep for whatever is left of the wait once they get the lock.
+        
+        Args:
+            response: Rate-limited response (see _is_rate_limited).
+        """
+        if 'Retry-After' in response.headers:
+            wait_time = int(response.headers['Retry-After'])
+        elif 'X-RateLimit-Reset' in response.headers:
+            wait_time = max(int(response.headers['X-RateLimit-Reset']) - time.time(), 0)
+        else:
+            wait_time = _DEFAULT_RATE_LIMIT_WAIT
+        resume_at = time.time() + wait_time
+        
+        with self._rate_limit_lock:
+            remaining_wait = resume_at - time.time()
+            if remaining_wait > 0:
+                logging.warning(f"Rate limited ({response.status_code}). Retrying after {remaining_wait:.0f}s...")
+                time.sleep(remaining_wait)
     
     @retry(
         stop=stop_after_attempt(3),
@@ -55,32 +193,42 @@ class GitHubClient:
             Response object.
             
         Raises:
-            SystemExit: If request fails after retries or rate limit exceeded.
+            GitHubAPIError: If GitHub returns an error response.
+            requests.exceptions.RequestException: If the request fails after retries.
         """
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            cached = self.http_cache.load(url, params) if self.http_cache else None
+            headers = {'If-None-Match': cached['etag']} if cached else None
             
-            # Check rate limit
-            remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-            if remaining < 10:
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                wait_time = max(reset_time - time.time(), 0) + 5
-                logging.warning(f"GitHub rate limit low ({remaining} remaining). Waiting {wait_time}s...")
-                time.sleep(wait_time)
+            for attempt in range(1, _MAX_RATE_LIMITED_ATTEMPTS + 1):
+                # Block while another worker is waiting for the rate limit to reset
+                with self._rate_limit_lock:
+                    pass
+                
+                with self._request_slots:
+                    response = self.session.get(url, headers=headers, params=params, timeout=30)
+                self._respect_rate_limit(response)
+                
+                # Handle rate limiting (429 or rate-limit 403); the last one falls through to the error below
+                if not _is_rate_limited(response) or attempt == _MAX_RATE_LIMITED_ATTEMPTS:
+                    break
+                self._wait_for_rate_limit(response)
             
-            # Handle rate limit exceeded (429)
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                logging.warning(f"Rate limited. Retrying after {retry_after}s...")
-                time.sleep(retry_after)
-                return self._make_request(url, params)
+            # Unchanged since last run: serve the cached body (304s don't count against the rate limit)
+            if response.status_code == 304 and cached:
+                return self.http_cache.replay(response, cached)
             
             # Check for errors
             if response.status_code >= 400:
                 logging.error(f"GitHub API error: {response.status_code} - {response.text}")
-                sys.exit(1)
+                raise GitHubAPIError(
+                    f"GitHub API error {response.status_code} for {url}",
+                    status_code=response.status_code
+                )
             
             response.raise_for_status()
+            if self.http_cache:
+                self.http_cache.store(url, params, response)
             return response
             
         except requests.exceptions.RequestException as e:
@@ -99,7 +247,7 @@ class GitHubClient:
         Returns:
             List of pull request dictionaries.
         """
-        url = f"{self.base_url}/repos/{self.organization}/{repo}/pulls"
+        url = f"{self._repo_url(repo)}/pulls"
         params = {
             'state': state,
             'per_page': per_page,
@@ -112,7 +260,7 @@ class GitHubClient:
         
         while True:
             response = self._make_request(url, params)
-            prs = response.json()
+            prs = parse_json_response(response)
             
             if not prs:
                 break
@@ -120,8 +268,8 @@ class GitHubClient:
             # Filter by date range
             filtered_prs = []
             for pr in prs:
-                created_at = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00'))
-                if created_at >= self.since_date:
+                # created_at is always "YYYY-MM-DDTHH:MM:SSZ", so comparing strings compares dates
+                if pr['created_at'] >= self._since_timestamp:
                     filtered_prs.append(pr)
                 else:
                     # Since PRs are sorted by created date desc, we can stop here
@@ -141,116 +289,66 @@ class GitHubClient:
         
         return all_prs
     
-    def get_pr_comments(self, repo: str, pr_number: int) -> int:
+    def get_pr_detail(self, repo: str, pr_number: int) -> Dict[str, Any]:
         """
-        Get total comment count for a PR (review comments + issue comments).
+        Get the full pull request object, which includes the comment, commit and
+        changed-file totals that the list endpoint omits.
         
         Args:
             repo: Repository name.
             pr_number: Pull request number.
             
         Returns:
-            Total number of comments.
+            Pull request dictionary from the single-PR endpoint.
         """
-        # Get review comments (code-level comments)
-        review_comments_url = f"{self.base_url}/repos/{self.organization}/{repo}/pulls/{pr_number}/comments"
-        review_response = self._make_request(review_comments_url, {'per_page': 100})
-        review_comments = review_response.json()
-        
-        # Paginate if necessary
-        review_count = len(review_comments)
-        page = 2
-        while len(review_comments) == 100:
-            response = self._make_request(review_comments_url, {'per_page': 100, 'page': page})
-            more_comments = response.json()
-            if not more_comments:
-                break
-            review_count += len(more_comments)
-            page += 1
-        
-        # Get issue comments (general discussion)
-        issue_comments_url = f"{self.base_url}/repos/{self.organization}/{repo}/issues/{pr_number}/comments"
-        issue_response = self._make_request(issue_comments_url, {'per_page': 100})
-        issue_comments = issue_response.json()
-        
-        # Paginate if necessary
-        issue_count = len(issue_comments)
-        page = 2
-        while len(issue_comments) == 100:
-            response = self._make_request(issue_comments_url, {'per_page': 100, 'page': page})
-            more_comments = response.json()
-            if not more_comments:
-                break
-            issue_count += len(more_comments)
-            page += 1
-        
-        return review_count + issue_count
-    
-    def get_pr_commits(self, repo: str, pr_number: int) -> int:
-        """
-        Get commit count for a PR.
-        
-        Args:
-            repo: Repository name.
-            pr_number: Pull request number.
-            
-        Returns:
-            Number of commits.
-        """
-        url = f"{self.base_url}/repos/{self.organization}/{repo}/pulls/{pr_number}/commits"
-        response = self._make_request(url, {'per_page': 100})
-        commits = response.json()
-        
-        # Count all commits with pagination
-        commit_count = len(commits)
-        page = 2
-        while len(commits) == 100:
-            response = self._make_request(url, {'per_page': 100, 'page': page})
-            more_commits = response.json()
-            if not more_commits:
-                break
-            commit_count += len(more_commits)
-            page += 1
-        
-        return commit_count
+        return parse_json_response(self._make_request(f"{self._repo_url(repo)}/pulls/{pr_number}"))
     
-    def get_pr_file_changes(self, repo: str, pr_number: int) -> int:
+    def _fetch_pr_row(self, repo_name: str, pr: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Get number of files changed in a PR.
+        Fetch the detail counts for one PR and build its CSV row.
         
         Args:
-            repo: Repository name.
-            pr_number: Pull request number.
+            repo_name: Repository name.
+            pr: Pull request dictionary from the list endpoint.
             
         Returns:
-            Number of files changed.
+            Dictionary with flattened PR data ready for CSV.
         """
-        url = f"{self.base_url}/repos/{self.organization}/{repo}/pulls/{pr_number}/files"
-        response = self._make_request(url, {'per_page': 100})
-        files = response.json()
+        pr_number = pr['number']
+        is_merged = pr.get('merged_at') is not None
         
-        # Count all files with pagination
-        file_count = len(files)
-        page = 2
-        while len(files) == 100:
-            response = self._make_request(url, {'per_page': 100, 'page': page})
-            more_files = response.json()
-            if not more_files:
-                break
-            file_count += len(more_files)
-            page += 1
+        # Counts of unmerged PRs are not used by any metric; skip their detail request
+        detail = {}
+        if is_merged or self.fetch_details_for_unmerged:
+            try:
+                detail = self.get_pr_detail(repo_name, pr_number)
+            except Exception as e:
+                logging.error(f"Failed to fetch details for PR #{pr_number} in {repo_name}: {e}")
+                raise
         
-        return file_count
+        # Extract and format data
+        return {
+            'repository': repo_name,
+            'pr_name': pr.get('title', ''),
+            'pr_number': pr_number,
+            'created_at': format_timestamp_for_csv(pr.get('created_at')),
+            'merged_at': format_timestamp_for_csv(pr.get('merged_at')),
+            'is_merged': is_merged,
+            # Issue comments (general discussion) + review comments (code-level comments)
+            'num_comments': detail.get('comments', 0) + detail.get('review_comments', 0),
+            'num_commits': detail.get('commits', 0),
+            'num_files_changed': detail.get('changed_files', 0)
+        }
     
-    def fetch_all_pr_data(self, repo_config: Dict[str, str]) -> List[Dict[str, Any]]:
+    def iter_pr_data(self, repo_config: Dict[str, str]) -> Iterator[Dict[str, Any]]:
         """
-        Fetch complete PR data for a repository.
+        Fetch PR data for a repository, yielding one CSV row at a time.
         
         Args:
             repo_config: Repository configuration dictionary.
             
-        Returns:
-            List of dictionaries with flattened PR data ready for CSV.
+        Yields:
+            Dictionaries with flattened PR data ready for CSV.
         """
         repo_name = repo_config['repository']
         logging.warning(f"Fetching PRs for {self.organization}/{repo_name}...")
@@ -259,40 +357,44 @@ class GitHubClient:
         prs = self.get_pull_requests(repo_name)
         logging.warning(f"Found {len(prs)} PRs in date range for {repo_name}")
         
-        csv_data = []
-        
-        for idx, pr in enumerate(prs, 1):
-            try:
-                pr_number = pr['number']
-                
-                # Fetch additional details
-                num_comments = self.get_pr_comments(repo_name, pr_number)
-                num_commits = self.get_pr_commits(repo_name, pr_number)
-                num_files_changed = self.get_pr_file_changes(repo_name, pr_number)
-                
-                # Extract and format data
-                row = {
-                    'repository': repo_name,
-                    'pr_name': pr.get('title', ''),
-                    'pr_number': pr_number,
-                    'created_at': format_timestamp_for_csv(pr.get('created_at')),
-                    'merged_at': format_timestamp_for_csv(pr.get('merged_at')),
-                    'is_merged': pr.get('merged_at') is not None,
-                    'num_comments': num_comments,
-                    'num_commits': num_commits,
-                    'num_files_changed': num_files_changed
-                }
-                
-                csv_data.append(row)
+        # Details for several PRs are fetched in parallel; map() keeps the original PR order
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            rows = executor.map(lambda pr: self._fetch_pr_row(repo_name, pr), prs)
+            for idx, row in enumerate(rows, 1):
+                yield row
                 
                 # Log progress every 10 PRs
                 if idx % 10 == 0:
                     logging.warning(f"Processed {idx}/{len(prs)} PRs for {repo_name}")
-                
-            except Exception as e:
-                logging.error(f"Failed to fetch details for PR #{pr_number} in {repo_name}: {e}")
-                sys.exit(1)
+        finally:
+            # On failure, drop the PRs that have not started instead of fetching them
+            executor.shutdown(wait=True, cancel_futures=True)
         
-        logging.warning(f"Completed fetching {len(csv_data)} PRs for {repo_name}")
-        return csv_data
-
+        logging.warning(f"Completed fetching {len(prs)} PRs for {repo_name}")
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=2, min=5, max=60),
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True
+    )
+    def fetch_all_pr_data(self, repo_config: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Fetch complete PR data for a repository.
+        
+        Transient failures (network errors, GitHub 5xx) restart the repository fetch
+        with exponential backoff; pages already seen are revalidated cheaply when the
+        response cache is enabled.
+        
+        Args:
+            repo_config: Repository configuration dictionary.
+            
+        Returns:
+            List of dictionaries with flattened PR data ready for CSV.
+            
+        Raises:
+            GitHubAPIError: If GitHub keeps returning errors for the repository.
+            requests.exceptions.RequestException: If the network keeps failing.
+        """
+        return list(self.iter_pr_data(repo_config))
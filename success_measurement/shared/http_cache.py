@@ -0,0 +1,158 @@
+"""
+On-disk HTTP response cache for conditional (ETag / If-None-Match) requests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+# Response headers that callers read and that must survive a 304 replay
+_REPLAYED_HEADERS = ('Link', 'Content-Type')
+
+# Entries not used for this long are deleted when the cache is opened (e.g. PRs that
+# dropped out of the date range), so the directory does not grow without bound
+_MAX_ENTRY_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+class HttpCache:
+    """
+    Store response bodies alongside their ETag so repeat runs can revalidate
+    with If-None-Match instead of downloading unchanged resources again.
+    
+    Entries are touched whenever they are loaded; entries (and leftover temp files)
+    unused for _MAX_ENTRY_AGE_SECONDS are pruned when the cache is opened.
+    """
+    
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory where cache entries are stored (created if missing).
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.prune(_MAX_ENTRY_AGE_SECONDS)
+    
+    def prune(self, max_age_seconds: float) -> int:
+        """
+        Delete cache files that have not been used for max_age_seconds.
+        
+        Args:
+            max_age_seconds: Age (since last load or store) after which a file is deleted.
+            
+        Returns:
+            Number of files deleted.
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                            removed += 1
+                    except OSError:
+                        # Removed concurrently or not accessible; try again next run
+                        continue
+        except OSError as e:
+            logging.warning(f"Could not prune HTTP cache {self.cache_dir}: {e}")
+        return removed
+    
+    def _key_path(self, key: str) -> Path:
+        """Build the cache file path for a key."""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+    
+    def _entry_path(self, url: str, params: Optional[Dict]) -> Path:
+        """Build the cache file path for a request (URL + sorted query params)."""
+        return self._key_path(f"{url}?{json.dumps(params or {}, sort_keys=True)}")
+    
+    @staticmethod
+    def _read(path: Path) -> Optional[Any]:
+        """Read a JSON cache file, or None if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write(path: Path, entry: Any) -> None:
+        """Write a JSON cache file atomically."""
+        # Write to a per-thread temp file and rename, so concurrent workers never see partial entries
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write HTTP cache entry {path.name}: {e}")
+    
+    def load(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached entry for a request.
+        
+        Args:
+            url: Request URL.
+            params: Query parameters.
+        
+        Returns:
+            Dictionary with 'etag', 'headers' and 'body', or None if not cached.
+        """
+        path = self._entry_path(url, params)
+        entry = self._read(path)
+        if entry is not None:
+            # Mark the entry as used so prune() keeps it
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return entry
+    
+    def store(self, url: str, params: Optional[Dict], response: requests.Response) -> None:
+        """
+        Store a successful response if the server supplied an ETag.
+        
+        Args:
+            url: Request URL.
+            params: Query parameters.
+            response: Response to cache.
+        """
+        etag = response.headers.get('ETag')
+        if not etag:
+            return
+        
+        entry = {
+            'etag': etag,
+            'headers': {name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers},
+            'body': response.text
+        }
+        
+        self._write(self._entry_path(url, params), entry)
+    
+    @staticmethod
+    def replay(response: requests.Response, entry: Dict[str, Any]) -> requests.Response:
+        """
+        Turn a 304 Not Modified response into the cached 200 response.
+        
+        Args:
+            response: The 304 response returned by the server.
+            entry: Cached entry previously returned by load().
+        
+        Returns:
+            The same response object carrying the cached body and headers.
+        """
+        response.status_code = 200
+        response._content = entry['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers.update(entry.get('headers', {}))
+        return response
@@ -2,23 +2,113 @@
 Jira API client for fetching issue data and changelog information.
 """
 
-import base64
 import logging
-import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential, retry_if_exception
 
-from .utils import format_timestamp_for_csv, format_date_for_jira, calculate_date_range
+from .utils import format_timestamp_for_csv, format_date_for_jira, calculate_date_range, parse_json_response
 from dateutil.relativedelta import relativedelta
 
 
+class JiraAPIError(requests.exceptions.RequestException):
+    """Raised when the Jira API returns an error response."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Return True for failures worth retrying: network errors, Jira 429 and 5xx responses."""
+    if isinstance(error, JiraAPIError):
+        return error.status_code is not None and (error.status_code == 429 or error.status_code >= 500)
+    return isinstance(error, requests.exceptions.RequestException)
+
+
+def _parse_retry_after(response: requests.Response) -> Optional[float]:
+    """Return the Retry-After delay in seconds, or None if absent or not a number."""
+    try:
+        return max(float(response.headers['Retry-After']), 0)
+    except (KeyError, ValueError):
+        return None
+
+
+_backoff_wait = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as Jira's Retry-After header asks; otherwise back off exponentially."""
+    error = retry_state.outcome.exception()
+    if isinstance(error, JiraAPIError) and error.retry_after is not None:
+        logging.warning(f"Jira rate limited. Retrying after {error.retry_after}s...")
+        return error.retry_after
+    return _backoff_wait(retry_state)
+
+
+def _keep_status_changes(histories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reduce changelog histories to their status changes, the only items that are read.
+    
+    Args:
+        histories: Changelog histories as returned by Jira.
+        
+    Returns:
+        Histories with only 'created' and their status items; histories without
+        a status change are dropped.
+    """
+    slim_histories = []
+    for history in histories:
+        status_items = [item for item in history.get('items', []) if item.get('field') == 'status']
+        if status_items:
+            slim_histories.append({'created': history.get('created'), 'items': status_items})
+    return slim_histories
+
+
+@dataclass(slots=True)
+class IssueLite:
+    """The parts of a Jira issue that are written to the CSV."""
+    
+    key: str
+    summary: str
+    issuetype: str
+    created: Optional[str]
+    histories: List[Dict[str, Any]]
+    
+    @classmethod
+    def from_api(cls, issue: Dict[str, Any]) -> 'IssueLite':
+        """
+        Flatten an issue from the search response, keeping only status changes.
+        
+        Args:
+            issue: Issue dictionary with expanded changelog.
+            
+        Returns:
+            IssueLite holding the CSV fields and status-change histories.
+        """
+        fields = issue.get('fields') or {}
+        return cls(
+            key=issue['key'],
+            summary=fields.get('summary', ''),
+            issuetype=(fields.get('issuetype') or {}).get('name', ''),
+            created=fields.get('created'),
+            histories=_keep_status_changes((issue.get('changelog') or {}).get('histories', []))
+        )
+
+
 class JiraClient:
     """Client for interacting with Jira/Atlassian REST API."""
     
-    def __init__(self, email: str, api_token: str, base_url: str, date_range_months: int = 12):
+    def __init__(self, email: str, api_token: str, base_url: str, date_range_months: int = 12,
+                 max_workers: int = 8):
         """
         Initialize Jira client.
         
@@ -27,31 +117,44 @@ class JiraClient:
             api_token: Atlassian API token.
             base_url: Base URL for Jira instance.
             date_range_months: Number of months to look back for data.
+            max_workers: Number of monthly chunks fetched in parallel.
         """
         self.email = email
         self.api_token = api_token
         self.base_url = base_url.rstrip('/')
         self.date_range_months = date_range_months  # Store for monthly chunking
-        
-        # Create Basic Auth header
-        auth_string = f"{email}:{api_token}"
-        auth_bytes = auth_string.encode('utf-8')
-        auth_b64 = base64.b64encode(auth_bytes).decode('utf-8')
+        self.max_workers = max_workers
         
         self.headers = {
-            "Authorization": f"Basic {auth_b64}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
         
+        # Reuse connections to the Jira host instead of reconnecting on every request
+        self.session = requests.Session()
+        self.session.auth = HTTPBasicAuth(email, api_token)
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+        
         # Calculate date range (kept for backward compatibility)
         self.since_date = calculate_date_range(date_range_months)
         self.since_date_str = format_date_for_jira(self.since_date)
     
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> 'JiraClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((requests.exceptions.RequestException, requests.exceptions.Timeout))
+        wait=_wait_before_retry,
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True
     )
     def _make_request(self, url: str, params: Optional[Dict] = None, method: str = 'GET', json_data: Optional[Dict] = None) -> requests.Response:
         """
@@ -67,184 +170,205 @@ class JiraClient:
             Response object.
             
         Raises:
-            SystemExit: If request fails after retries.
+            JiraAPIError: If Jira returns an error response.
+            requests.exceptions.RequestException: If the request fails after retries.
         """
         try:
             if method == 'POST':
-                response = requests.post(url, headers=self.headers, json=json_data, timeout=30)
+                response = self.session.post(url, json=json_data, timeout=30)
             else:
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
+                response = self.session.get(url, params=params, timeout=30)
             
             # Check for errors
             if response.status_code >= 400:
-                logging.error(f"Jira API error: {response.status_code} - {response.text}")
-                sys.exit(1)
+                logging.error(f"Jira API error: {response.status_code} - {response.text[:200]}")
+                raise JiraAPIError(
+                    f"Jira API error {response.status_code} for {url}",
+                    status_code=response.status_code,
+                    retry_after=_parse_retry_after(response)
+                )
             
             response.raise_for_status()
             return response
             
+        except JiraAPIError:
+            raise
         except requests.exceptions.RequestException as e:
             logging.error(f"Jira API request failed: {e}")
             raise
     
-    def _fetch_issues_for_period(self, project_key: str, start_date: datetime, end_date: datetime, 
-                                   seen_keys: set, depth: int = 0) -> List[Dict[str, Any]]:
+    def _fetch_issues_for_period(self, project_key: str, start_date: datetime, end_date: datetime,
+                                   updated_since: Optional[datetime] = None) -> List[IssueLite]:
         """
-        Recursively fetch issues for a date range, subdividing if we hit the 100-issue limit.
+        Fetch all issues for a date range, following nextPageToken until the last page.
         
         Args:
             project_key: Jira project key.
             start_date: Start date of period.
             end_date: End date of period.
-            seen_keys: Set of already-seen issue keys to avoid duplicates.
-            depth: Recursion depth (for safety).
+            updated_since: If set, only return issues updated on or after this date.
             
         Returns:
             List of issues for this period.
+            
+        Raises:
+            requests.exceptions.RequestException: If a page cannot be fetched.
         """
-        if depth > 10:  # Safety: max 10 levels of subdivision
-            logging.warning(f"    Max recursion depth reached")
-            return []
-        
         base_url = f"{self.base_url}/rest/api/3/search/jql"
         
         start_str = format_date_for_jira(start_date)
         end_str = format_date_for_jira(end_date)
         
-        jql = f'project={project_key} AND created >= "{start_str}" AND created <= "{end_str}" ORDER BY created DESC'
+        # Half-open range, so adjacent periods never return the same issue
+        jql = f'project={project_key} AND created >= "{start_str}" AND created < "{end_str}"'
+        if updated_since:
+            jql += f' AND updated >= "{format_date_for_jira(updated_since)}"'
+        jql += ' ORDER BY created DESC'
         
-        params = {
+        body = {
             'jql': jql,
-            'startAt': 0,
-            'maxResults': 1000,
+            'maxResults': 100,
             'expand': 'changelog',
-            'fields': 'key,summary,issuetype,created,status'
+            # Only what the CSV needs; the issue key is always returned
+            'fields': ['summary', 'issuetype', 'created']
         }
         
+        issues = []
         try:
-            response = self._make_request(base_url, params=params, method='GET')
-            data = response.json()
-            
-            issues = data.get('issues', [])
-            
-            # If we got exactly 100 issues, we likely hit the limit - subdivide
-            if len(issues) == 100:
-                indent = "  " * (depth + 2)
-                logging.warning(f"{indent}⚠️  Hit 100-issue limit! Subdividing period...")
+            while True:
+                response = self._make_request(base_url, method='POST', json_data=body)
+                data = parse_json_response(response)
+                # Flatten right away so the full issue dicts are released with the page
+                issues.extend(IssueLite.from_api(issue) for issue in data.get('issues', []))
                 
-                # Calculate midpoint
-                period_days = (end_date - start_date).days
-                if period_days <= 1:
-                    # Can't subdivide further - return what we have
-                    logging.warning(f"{indent}Cannot subdivide further (1 day period)")
+                next_page_token = data.get('nextPageToken')
+                if data.get('isLast') or not next_page_token:
                     return issues
-                
-                mid_date = start_date + relativedelta(days=period_days // 2)
-                mid_str = format_date_for_jira(mid_date)
-                
-                logging.warning(f"{indent}Splitting into: {start_str} to {mid_str} and {mid_str} to {end_str}")
-                
-                # Fetch first half
-                issues_part1 = self._fetch_issues_for_period(project_key, start_date, mid_date, seen_keys, depth + 1)
-                
-                # Fetch second half
-                issues_part2 = self._fetch_issues_for_period(project_key, mid_date, end_date, seen_keys, depth + 1)
-                
-                return issues_part1 + issues_part2
-            
-            return issues
+                body['nextPageToken'] = next_page_token
             
         except Exception as e:
             logging.error(f"Failed to fetch issues for {start_str} to {end_str}: {e}")
-            return []
+            raise
     
-    def get_all_issues(self, project_key: str) -> List[Dict[str, Any]]:
+    def get_window_start(self) -> datetime:
         """
-        Fetch all issues for a project by breaking down into monthly chunks.
-        Automatically subdivides months that hit the 100-issue API limit.
+        Get the creation date of the oldest issue covered by get_all_issues.
+        
+        Returns:
+            Start of the oldest monthly chunk.
+        """
+        return datetime.now() - relativedelta(months=self.date_range_months)
+    
+    def _month_ranges(self, end_date: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        Split the look-back window ending at end_date into monthly chunks.
         
         Args:
-            project_key: Jira project key (e.g., "OA").
+            end_date: End of the newest chunk (usually now).
             
         Returns:
-            List of issue dictionaries with changelog.
+            (start, end) pairs, newest first. Each chunk ends where the next older one
+            starts, so as half-open ranges they neither overlap nor leave gaps.
         """
-        all_issues = []
-        seen_keys = set()  # Track issue keys to avoid duplicates
-        
-        # Calculate monthly date ranges
-        end_date = datetime.now()
+        # N + 1 boundaries computed once; month k covers [boundaries[k + 1], boundaries[k])
+        boundaries = [end_date - relativedelta(months=month_offset)
+                      for month_offset in range(self.date_range_months + 1)]
+        return list(zip(boundaries[1:], boundaries[:-1]))
+    
+    def _iter_all_issues(self, project_key: str, updated_since: Optional[datetime] = None) -> Iterator[IssueLite]:
+        """
+        Fetch all issues for a project in monthly chunks, yielding them month by month.
         
-        logging.warning(f"Fetching issues month-by-month for last {self.date_range_months} months...")
-        logging.warning(f"Note: Months with 100+ issues will be automatically subdivided")
+        Months are fetched in parallel but yielded newest first, each as soon as it is
+        complete; a month's issues are released once the caller has consumed them.
         
-        for month_offset in range(self.date_range_months):
-            # Calculate start and end of this month chunk
-            month_end = end_date - relativedelta(months=month_offset)
-            month_start = month_end - relativedelta(months=1)
+        Args:
+            project_key: Jira project key (e.g., "OA").
+            updated_since: If set, only fetch issues updated on or after this date.
             
-            start_str = format_date_for_jira(month_start)
-            end_str = format_date_for_jira(month_end)
+        Yields:
+            Issues with their status-change histories.
             
-            logging.warning(f"Month {month_offset + 1}/{self.date_range_months}: {start_str} to {end_str}")
+        Raises:
+            requests.exceptions.RequestException: If any month cannot be fetched.
+        """
+        total_issues = 0
+        
+        logging.warning(f"Fetching issues month-by-month for last {self.date_range_months} months...")
+        if updated_since:
+            logging.warning(f"Only fetching issues updated since {format_date_for_jira(updated_since)}")
+        
+        month_ranges = self._month_ranges(datetime.now())
+        
+        # A failed month aborts the fetch: skipping it would leave a gap in the data
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(month_ranges))))
+        try:
+            pending = deque(
+                (month_start, month_end,
+                 executor.submit(self._fetch_issues_for_period, project_key, month_start, month_end,
+                                 updated_since=updated_since))
+                for month_start, month_end in month_ranges
+            )
             
-            try:
-                # Fetch issues for this month (with automatic subdivision if needed)
-                month_issues = self._fetch_issues_for_period(project_key, month_start, month_end, seen_keys, depth=0)
+            month_offset = 0
+            while pending:
+                month_start, month_end, future = pending.popleft()
+                month_offset += 1
+                start_str = format_date_for_jira(month_start)
+                end_str = format_date_for_jira(month_end)
                 
-                # Add only new issues (avoid duplicates at boundaries)
-                new_issues = 0
-                for issue in month_issues:
-                    issue_key = issue.get('key')
-                    if issue_key and issue_key not in seen_keys:
-                        all_issues.append(issue)
-                        seen_keys.add(issue_key)
-                        new_issues += 1
+                logging.warning(f"Month {month_offset}/{self.date_range_months}: {start_str} to {end_str}")
                 
-                logging.warning(f"  Total for month: {new_issues} unique issues ({len(month_issues) - new_issues} duplicates skipped)")
-                    
-            except Exception as e:
-                logging.error(f"Failed to fetch issues for month {start_str} to {end_str}: {e}")
-                continue
+                try:
+                    # Issues for this month (all pages)
+                    month_issues = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to fetch issues for month {start_str} to {end_str}: {e}")
+                    raise
+                
+                logging.warning(f"  Total for month: {len(month_issues)} issues")
+                total_issues += len(month_issues)
+                yield from month_issues
+        finally:
+            # On failure, drop the months that have not started instead of fetching them
+            executor.shutdown(wait=True, cancel_futures=True)
         
-        logging.warning(f"Total unique issues fetched: {len(all_issues)}")
-        return all_issues
+        logging.warning(f"Total issues fetched: {total_issues}")
     
-    def get_issue_changelog(self, issue_key: str) -> List[Dict[str, Any]]:
+    def get_all_issues(self, project_key: str, updated_since: Optional[datetime] = None) -> List[IssueLite]:
         """
-        Get changelog for a specific issue (if not already expanded).
+        Fetch all issues for a project by breaking down into monthly chunks.
+        Each month is paginated with nextPageToken, so there is no per-request issue limit.
         
         Args:
-            issue_key: Jira issue key (e.g., "OA-123").
+            project_key: Jira project key (e.g., "OA").
+            updated_since: If set, only fetch issues updated on or after this date
+                (incremental refresh); otherwise fetch every issue in the window.
             
         Returns:
-            List of changelog entries.
+            List of issues with their status-change histories.
+            
+        Raises:
+            requests.exceptions.RequestException: If any month cannot be fetched.
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        params = {'expand': 'changelog'}
-        
-        response = self._make_request(url, params)
-        data = response.json()
-        
-        changelog = data.get('changelog', {}).get('histories', [])
-        return changelog
+        return list(self._iter_all_issues(project_key, updated_since))
     
     def extract_status_timestamps(
         self, 
-        issue: Dict[str, Any], 
+        issue: IssueLite, 
         config_statuses: Dict[str, List[str]]
     ) -> Dict[str, Optional[str]]:
         """
         Extract LATEST status transition timestamps from issue changelog.
         
         Args:
-            issue: Issue dictionary with changelog.
+            issue: Issue with its status-change histories.
             config_statuses: Status configuration from config.yaml.
             
         Returns:
             Dictionary with 'in_progress_timestamp' and 'done_timestamp'.
         """
-        # Get target status names from config
+        # Get target status names from config (lists or sets)
         in_progress_statuses = config_statuses.get('in_progress', ['In Progress'])
         done_statuses = config_statuses.get('done', ['Done'])
         
@@ -252,26 +376,16 @@ class JiraClient:
         in_progress_timestamp = None
         done_timestamp = None
         
-        # Get changelog
-        changelog = issue.get('changelog', {}).get('histories', [])
-        
-        if not changelog:
-            # Try to fetch changelog separately if not expanded
-            try:
-                changelog = self.get_issue_changelog(issue['key'])
-            except Exception as e:
-                logging.warning(f"Could not fetch changelog for {issue['key']}: {e}")
-                return {
-                    'in_progress_timestamp': None,
-                    'done_timestamp': None
-                }
+        # Get changelog (expanded by the search; empty means the issue never changed status)
+        changelog = issue.histories
         
         # Parse changelog for status transitions
-        # We want the LATEST occurrence of each status
-        for history in changelog:
+        # We want the LATEST occurrence of each status: the last one in the changelog,
+        # so scan it backwards and stop once both are found
+        for history in reversed(changelog):
             created = history.get('created')
             
-            for item in history.get('items', []):
+            for item in reversed(history.get('items', [])):
                 # Only process status field changes
                 if item.get('field') != 'status':
                     continue
@@ -279,66 +393,93 @@ class JiraClient:
                 to_status = item.get('toString', '')
                 
                 # Check if this is a transition to "In Progress"
-                if to_status in in_progress_statuses:
+                if in_progress_timestamp is None and to_status in in_progress_statuses:
                     in_progress_timestamp = created
                 
                 # Check if this is a transition to "Done"
-                if to_status in done_statuses:
+                if done_timestamp is None and to_status in done_statuses:
                     done_timestamp = created
+            
+            if in_progress_timestamp is not None and done_timestamp is not None:
+                break
         
         return {
             'in_progress_timestamp': format_timestamp_for_csv(in_progress_timestamp),
             'done_timestamp': format_timestamp_for_csv(done_timestamp)
         }
     
-    def fetch_all_jira_data(self, project_key: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _build_row(self, issue: IssueLite, config_statuses: Dict[str, List[str]]) -> Dict[str, Any]:
         """
-        Fetch complete issue data for a Jira project.
+        Build the CSV row for one issue.
+        
+        Args:
+            issue: Issue with its status-change histories.
+            config_statuses: Status configuration from config.yaml.
+            
+        Returns:
+            Dictionary with flattened issue data ready for CSV.
+        """
+        timestamps = self.extract_status_timestamps(issue, config_statuses)
+        
+        return {
+            'ticket_key': issue.key,
+            'summary': issue.summary,
+            'type': issue.issuetype,
+            'created': format_timestamp_for_csv(issue.created),
+            'in_progress_timestamp': timestamps['in_progress_timestamp'],
+            'done_timestamp': timestamps['done_timestamp']
+        }
+    
+    def iter_jira_data(self, project_key: str, config: Dict[str, Any],
+                       updated_since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch issue data for a Jira project, yielding one CSV row at a time.
         
         Args:
             project_key: Jira project key.
             config: Full configuration dictionary.
+            updated_since: If set, only fetch issues updated on or after this date.
             
-        Returns:
-            List of dictionaries with flattened issue data ready for CSV.
+        Yields:
+            Dictionaries with flattened issue data ready for CSV.
         """
         logging.warning(f"Fetching Jira issues for project {project_key}...")
         
-        # Get all issues with changelog
-        issues = self.get_all_issues(project_key)
-        logging.warning(f"Found {len(issues)} issues in date range for {project_key}")
-        
-        csv_data = []
-        config_statuses = config.get('statuses', {})
+        # Status names as sets, built once for all issues
+        statuses = config.get('statuses', {})
+        config_statuses = {
+            'in_progress': frozenset(statuses.get('in_progress', ['In Progress'])),
+            'done': frozenset(statuses.get('done', ['Done']))
+        }
         
-        for idx, issue in enumerate(issues, 1):
+        # Issues arrive month by month; each is turned into its row and then dropped
+        idx = 0
+        for idx, issue in enumerate(self._iter_all_issues(project_key, updated_since), 1):
             try:
-                issue_key = issue['key']
-                fields = issue.get('fields', {})
-                
-                # Extract status timestamps
-                timestamps = self.extract_status_timestamps(issue, config_statuses)
-                
-                # Build CSV row
-                row = {
-                    'ticket_key': issue_key,
-                    'summary': fields.get('summary', ''),
-                    'type': fields.get('issuetype', {}).get('name', ''),
-                    'created': format_timestamp_for_csv(fields.get('created')),
-                    'in_progress_timestamp': timestamps['in_progress_timestamp'],
-                    'done_timestamp': timestamps['done_timestamp']
-                }
-                
-                csv_data.append(row)
-                
-                # Log progress every 50 issues
-                if idx % 50 == 0:
-                    logging.warning(f"Processed {idx}/{len(issues)} issues for {project_key}")
-                
+                row = self._build_row(issue, config_statuses)
             except Exception as e:
-                logging.error(f"Failed to process issue {issue.get('key', 'UNKNOWN')}: {e}")
-                sys.exit(1)
+                logging.error(f"Failed to process issue {issue.key}, skipping it: {e}")
+                continue
+            
+            yield row
+            
+            # Log progress every 50 issues
+            if idx % 50 == 0:
+                logging.warning(f"Processed {idx} issues for {project_key}")
         
-        logging.warning(f"Completed fetching {len(csv_data)} issues for {project_key}")
-        return csv_data
-
+        logging.warning(f"Completed fetching {idx} issues for {project_key}")
+    
+    def fetch_all_jira_data(self, project_key: str, config: Dict[str, Any],
+                            updated_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch complete issue data for a Jira project.
+        
+        Args:
+            project_key: Jira project key.
+            config: Full configuration dictionary.
+            updated_since: If set, only fetch issues updated on or after this date.
+            
+        Returns:
+            List of dictionaries with flattened issue data ready for CSV.
+        """
+        return list(self.iter_jira_data(project_key, config, updated_since))
@@ -8,7 +8,33 @@ import re
 import statistics
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
+
+
+# Ticket key prefix of a PR name: PREFIX-NUMBER: (case-insensitive for prefix, exact for numbers)
+_TICKET_RE = re.compile(r'^([A-Za-z]+)-(\d+):')
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse a CSV timestamp (YYYY-MM-DD HH:MM:SS) by slicing its fixed-width fields.
+    
+    Much faster than datetime.strptime, which re-interprets the format string on every call.
+    
+    Args:
+        value: Timestamp string as written by format_timestamp_for_csv.
+        
+    Returns:
+        Naive datetime object.
+        
+    Raises:
+        ValueError: If the string is not a valid timestamp in that format.
+    """
+    if len(value) != 19 or value[4] != '-' or value[7] != '-' or value[10] != ' ' \
+            or value[13] != ':' or value[16] != ':':
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d %H:%M:%S'")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]), int(value[17:19]))
 
 
 def parse_ticket_key_from_pr(pr_name: str) -> Optional[str]:
@@ -26,8 +52,7 @@ def parse_ticket_key_from_pr(pr_name: str) -> Optional[str]:
     if not pr_name:
         return None
     
-    # Match pattern: PREFIX-NUMBER: (case-insensitive for prefix, exact for numbers)
-    match = re.match(r'^([A-Za-z]+)-(\d+):', pr_name.strip())
+    match = _TICKET_RE.match(pr_name.strip())
     if match:
         prefix = match.group(1).upper()
         number = match.group(2)
@@ -36,22 +61,40 @@ def parse_ticket_key_from_pr(pr_name: str) -> Optional[str]:
     return None
 
 
+def build_ticket_key_set(jira_data: Iterable[Dict[str, Any]]) -> Set[str]:
+    """
+    Build the set of Jira ticket keys that PRs can be matched against.
+    
+    Args:
+        jira_data: Jira issue dictionaries.
+        
+    Returns:
+        Set of non-empty ticket keys.
+    """
+    return {issue['ticket_key'] for issue in jira_data if issue.get('ticket_key')}
+
+
 def match_prs_to_jira(jira_data: List[Dict[str, Any]], 
-                      github_data: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+                      github_data: List[Dict[str, Any]],
+                      valid_ticket_keys: Optional[Set[str]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Match GitHub PRs to Jira issues based on ticket key in PR name.
     
     Args:
         jira_data: List of Jira issue dictionaries.
         github_data: List of GitHub PR dictionaries.
+        valid_ticket_keys: Prebuilt result of build_ticket_key_set(jira_data), so callers
+            matching several PR sets build it only once. Built from jira_data if omitted.
         
     Returns:
         Tuple of (matched_prs, unmatched_pr_names):
-        - matched_prs: List of PR dicts with added 'ticket_key' field
+        - matched_prs: List of the matched PR dicts; each gets a 'ticket_key' field
+          added in place (the dicts are not copied)
         - unmatched_pr_names: List of PR names that couldn't be matched
     """
-    # Build set of valid Jira ticket keys for O(1) lookup
-    valid_ticket_keys = {issue['ticket_key'] for issue in jira_data if issue.get('ticket_key')}
+    # Set of valid Jira ticket keys for O(1) lookup
+    if valid_ticket_keys is None:
+        valid_ticket_keys = build_ticket_key_set(jira_data)
     
     matched_prs = []
     unmatched_pr_names = []
@@ -62,9 +105,8 @@ def match_prs_to_jira(jira_data: List[Dict[str, Any]],
         
         if ticket_key and ticket_key in valid_ticket_keys:
             # Add ticket_key to PR data for reference
-            pr_with_key = pr.copy()
-            pr_with_key['ticket_key'] = ticket_key
-            matched_prs.append(pr_with_key)
+            pr['ticket_key'] = ticket_key
+            matched_prs.append(pr)
         else:
             unmatched_pr_names.append(pr_name)
     
@@ -75,29 +117,37 @@ def match_prs_to_jira(jira_data: List[Dict[str, Any]],
 
 
 def calculate_change_lead_time(jira_data: List[Dict[str, Any]], 
-                                 github_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                 github_data: Iterable[Dict[str, Any]],
+                                 valid_ticket_keys: Optional[Set[str]] = None) -> Dict[str, Any]:
     """
     Calculate Change Lead Time: duration from PR creation to merge.
     Only includes merged PRs that match Jira tickets.
     
     Args:
         jira_data: List of Jira issue dictionaries.
-        github_data: List of GitHub PR dictionaries.
+        github_data: GitHub PR dictionaries (list or one-shot iterator, consumed once).
+        valid_ticket_keys: Prebuilt result of build_ticket_key_set(jira_data). Built
+            from jira_data if omitted.
         
     Returns:
         Dictionary with median time, averages, and counts.
     """
     logging.warning("Calculating Change Lead Time...")
     
-    # Filter for merged PRs only
-    merged_prs = [pr for pr in github_data if pr.get('is_merged') == 'True']
-    non_merged_count = len([pr for pr in github_data if pr.get('is_merged') != 'True'])
+    # Split merged from non-merged PRs in a single pass; only merged PRs are kept
+    merged_prs = []
+    non_merged_count = 0
+    for pr in github_data:
+        if pr.get('is_merged') == 'True':
+            merged_prs.append(pr)
+        else:
+            non_merged_count += 1
     
     logging.warning(f"  Merged PRs: {len(merged_prs)}")
     logging.warning(f"  Non-merged PRs: {non_merged_count}")
     
     # Match PRs to Jira issues
-    matched_prs, _ = match_prs_to_jira(jira_data, merged_prs)
+    matched_prs, _ = match_prs_to_jira(jira_data, merged_prs, valid_ticket_keys)
     
     if not matched_prs:
         logging.warning("  No matched PRs found for Change Lead Time calculation")
@@ -108,33 +158,38 @@ def calculate_change_lead_time(jira_data: List[Dict[str, Any]],
             'avg_commits': 0,
             'avg_files_changed': 0,
             'matched_pr_count': 0,
+            'merged_pr_count': len(merged_prs),
             'non_merged_pr_count': non_merged_count
         }
     
-    # Calculate lead times and collect stats
+    # Calculate lead times (kept for the median) and running totals of the PR stats
     lead_times_hours = []
-    comments_list = []
-    commits_list = []
-    files_changed_list = []
+    total_comments = 0
+    total_commits = 0
+    total_files_changed = 0
     
     for pr in matched_prs:
         try:
             # Parse timestamps
-            created = datetime.strptime(pr['created_at'], '%Y-%m-%d %H:%M:%S')
-            merged = datetime.strptime(pr['merged_at'], '%Y-%m-%d %H:%M:%S')
+            created = _parse_timestamp(pr['created_at'])
+            merged = _parse_timestamp(pr['merged_at'])
             
             # Calculate lead time in hours
             lead_time_hours = (merged - created).total_seconds() / 3600
-            lead_times_hours.append(lead_time_hours)
             
             # Collect PR stats
-            comments_list.append(int(pr.get('num_comments', 0)))
-            commits_list.append(int(pr.get('num_commits', 0)))
-            files_changed_list.append(int(pr.get('num_files_changed', 0)))
+            num_comments = int(pr.get('num_comments', 0))
+            num_commits = int(pr.get('num_commits', 0))
+            num_files_changed = int(pr.get('num_files_changed', 0))
             
         except (ValueError, KeyError) as e:
             logging.warning(f"  Skipping PR {pr.get('pr_name')} due to parsing error: {e}")
             continue
+        
+        lead_times_hours.append(lead_time_hours)
+        total_comments += num_comments
+        total_commits += num_commits
+        total_files_changed += num_files_changed
     
     if not lead_times_hours:
         logging.warning("  No valid lead times calculated")
@@ -145,6 +200,7 @@ def calculate_change_lead_time(jira_data: List[Dict[str, Any]],
             'avg_commits': 0,
             'avg_files_changed': 0,
             'matched_pr_count': 0,
+            'merged_pr_count': len(merged_prs),
             'non_merged_pr_count': non_merged_count
         }
     
@@ -152,9 +208,10 @@ def calculate_change_lead_time(jira_data: List[Dict[str, Any]],
     median_hours = statistics.median(lead_times_hours)
     median_days = median_hours / 24
     
-    avg_comments = statistics.mean(comments_list) if comments_list else 0
-    avg_commits = statistics.mean(commits_list) if commits_list else 0
-    avg_files_changed = statistics.mean(files_changed_list) if files_changed_list else 0
+    valid_count = len(lead_times_hours)
+    avg_comments = total_comments / valid_count
+    avg_commits = total_commits / valid_count
+    avg_files_changed = total_files_changed / valid_count
     
     logging.warning(f"  Median Lead Time: {median_days:.1f} days ({median_hours:.1f} hours)")
     logging.warning(f"  Based on {len(matched_prs)} matched PRs")
@@ -166,12 +223,134 @@ def calculate_change_lead_time(jira_data: List[Dict[str, Any]],
         'avg_commits': round(avg_commits, 1),
         'avg_files_changed': round(avg_files_changed, 1),
         'matched_pr_count': len(matched_prs),
+        'merged_pr_count': len(merged_prs),
         'non_merged_pr_count': non_merged_count
     }
 
 
+def _new_duration_bucket() -> Dict[str, Any]:
+    """Create the accumulator for one In Progress -> Done metric."""
+    return {'total': 0, 'complete': 0, 'in_progress': 0, 'hours': [], 'negative': [], 'parse_errors': []}
+
+
+def _collect_jira_durations(jira_data: List[Dict[str, Any]],
+                            cycle_issue_types: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute In Progress -> Done durations for Cycle Time and Bug Resolution Time in one pass.
+    
+    Each issue is classified once and its timestamps are parsed at most once, even when
+    it counts towards both metrics (e.g. if "Bug" is a tracked cycle time type).
+    
+    Args:
+        jira_data: List of Jira issue dictionaries.
+        cycle_issue_types: Issue types included in Cycle Time.
+        
+    Returns:
+        Dictionary with 'cycle' and 'bug' buckets. Each bucket holds the number of issues
+        of its types ('total'), with both timestamps ('complete') and with In Progress
+        but no Done timestamp ('in_progress'), the non-negative durations in hours
+        ('hours'), and the skipped issues: ticket keys with a negative duration
+        ('negative') and (ticket_key, error message) pairs for unparseable
+        timestamps ('parse_errors').
+    """
+    cycle_issue_types = frozenset(cycle_issue_types)
+    cycle = _new_duration_bucket()
+    bug = _new_duration_bucket()
+    
+    for issue in jira_data:
+        issue_type = issue.get('type')
+        buckets = []
+        if issue_type in cycle_issue_types:
+            buckets.append(cycle)
+        if issue_type == 'Bug':
+            buckets.append(bug)
+        if not buckets:
+            continue
+        
+        in_progress_ts = issue.get('in_progress_timestamp')
+        done_ts = issue.get('done_timestamp')
+        has_in_progress = bool(in_progress_ts and in_progress_ts.strip())
+        has_done = bool(done_ts and done_ts.strip())
+        
+        for bucket in buckets:
+            bucket['total'] += 1
+        
+        if has_in_progress and not has_done:
+            # Still in progress (has In Progress but no Done)
+            for bucket in buckets:
+                bucket['in_progress'] += 1
+            continue
+        if not (has_in_progress and has_done):
+            continue
+        
+        for bucket in buckets:
+            bucket['complete'] += 1
+        
+        try:
+            in_progress = _parse_timestamp(in_progress_ts)
+            hours = (_parse_timestamp(done_ts) - in_progress).total_seconds() / 3600
+        except ValueError as e:
+            for bucket in buckets:
+                bucket['parse_errors'].append((issue.get('ticket_key'), str(e)))
+            continue
+        
+        for bucket in buckets:
+            if hours >= 0:
+                bucket['hours'].append(hours)
+            else:
+                # Negative times are a data quality issue and are skipped
+                bucket['negative'].append(issue.get('ticket_key'))
+    
+    return {'cycle': cycle, 'bug': bug}
+
+
+def _log_skipped_issues(bucket: Dict[str, Any], duration_name: str) -> None:
+    """
+    Log the issues a duration bucket skipped.
+    
+    Args:
+        bucket: Bucket from _collect_jira_durations().
+        duration_name: Name used for negative durations (e.g. "cycle time").
+    """
+    for ticket_key in bucket['negative']:
+        logging.warning(f"  Skipping {ticket_key} - negative {duration_name}")
+    for ticket_key, error in bucket['parse_errors']:
+        logging.warning(f"  Skipping {ticket_key} due to parsing error: {error}")
+
+
+def _duration_stats(hours: List[float], metric_name: str, item_name: str) -> Dict[str, Any]:
+    """
+    Summarize In Progress -> Done durations and log the result.
+    
+    Args:
+        hours: Non-empty list of durations in hours.
+        metric_name: Metric name used in the log output (e.g. "Cycle Time").
+        item_name: Plural name of the counted items (e.g. "issues").
+        
+    Returns:
+        Dictionary with rounded median and average (days and hours) and the completed count.
+    """
+    median_hours = statistics.median(hours)
+    median_days = median_hours / 24
+    avg_hours = statistics.fmean(hours)
+    avg_days = avg_hours / 24
+    
+    logging.warning(f"  Median {metric_name}: {median_days:.1f} days ({median_hours:.1f} hours)")
+    logging.warning(f"  Average {metric_name}: {avg_days:.1f} days ({avg_hours:.1f} hours)")
+    logging.warning(f"  Based on {len(hours)} completed {item_name}")
+    
+    return {
+        'median_days': round(median_days, 1),
+        'median_hours': round(median_hours, 1),
+        'avg_days': round(avg_days, 1),
+        'avg_hours': round(avg_hours, 1),
+        'completed_count': len(hours)
+    }
+
+
 def calculate_cycle_time(jira_data: List[Dict[str, Any]], 
-                         issue_types: List[str]) -> Dict[str, Any]:
+                         issue_types: List[str],
+                         durations: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
     """
     Calculate Cycle Time: duration from In Progress to Done for Jira issues.
     Only includes issues with both timestamps.
@@ -179,6 +358,8 @@ def calculate_cycle_time(jira_data: List[Dict[str, Any]],
     Args:
         jira_data: List of Jira issue dictionaries.
         issue_types: List of issue types to include (e.g., ["Story", "Sub-task"]).
+        durations: Result of _collect_jira_durations() for the same issue types, to
+            share one pass over jira_data with Bug Resolution Time. Computed if omitted.
         
     Returns:
         Dictionary with median time, averages, and counts.
@@ -186,35 +367,15 @@ def calculate_cycle_time(jira_data: List[Dict[str, Any]],
     logging.warning("Calculating Cycle Time...")
     logging.warning(f"  Including issue types: {', '.join(issue_types)}")
     
-    # Filter for specified issue types
-    filtered_issues = [
-        issue for issue in jira_data 
-        if issue.get('type') in issue_types
-    ]
-    
-    logging.warning(f"  Total issues of specified types: {len(filtered_issues)}")
-    
-    # Filter for issues with both timestamps
-    issues_with_timestamps = [
-        issue for issue in filtered_issues
-        if issue.get('in_progress_timestamp') and 
-           issue.get('done_timestamp') and
-           issue.get('in_progress_timestamp').strip() and
-           issue.get('done_timestamp').strip()
-    ]
-    
-    # Count issues still in progress (have in_progress but no done)
-    in_progress_only = [
-        issue for issue in filtered_issues
-        if issue.get('in_progress_timestamp') and 
-           issue.get('in_progress_timestamp').strip() and
-           (not issue.get('done_timestamp') or not issue.get('done_timestamp').strip())
-    ]
-    
-    logging.warning(f"  Issues with complete timestamps: {len(issues_with_timestamps)}")
-    logging.warning(f"  Issues still in progress: {len(in_progress_only)}")
-    
-    if not issues_with_timestamps:
+    if durations is None:
+        durations = _collect_jira_durations(jira_data, issue_types)
+    bucket = durations['cycle']
+    
+    logging.warning(f"  Total issues of specified types: {bucket['total']}")
+    logging.warning(f"  Issues with complete timestamps: {bucket['complete']}")
+    logging.warning(f"  Issues still in progress: {bucket['in_progress']}")
+    
+    if not bucket['complete']:
         logging.warning("  No issues with complete timestamps for Cycle Time calculation")
         return {
             'median_days': 0,
@@ -222,31 +383,12 @@ def calculate_cycle_time(jira_data: List[Dict[str, Any]],
             'avg_days': 0,
             'avg_hours': 0,
             'completed_count': 0,
-            'in_progress_count': len(in_progress_only),
+            'in_progress_count': bucket['in_progress'],
             'issue_types_tracked': issue_types
         }
     
-    # Calculate cycle times
-    cycle_times_hours = []
-    
-    for issue in issues_with_timestamps:
-        try:
-            # Parse timestamps
-            in_progress = datetime.strptime(issue['in_progress_timestamp'], '%Y-%m-%d %H:%M:%S')
-            done = datetime.strptime(issue['done_timestamp'], '%Y-%m-%d %H:%M:%S')
-            
-            # Calculate cycle time in hours
-            cycle_time_hours = (done - in_progress).total_seconds() / 3600
-            
-            # Skip negative times (data quality issue)
-            if cycle_time_hours >= 0:
-                cycle_times_hours.append(cycle_time_hours)
-            else:
-                logging.warning(f"  Skipping {issue.get('ticket_key')} - negative cycle time")
-            
-        except (ValueError, KeyError) as e:
-            logging.warning(f"  Skipping {issue.get('ticket_key')} due to parsing error: {e}")
-            continue
+    _log_skipped_issues(bucket, 'cycle time')
+    cycle_times_hours = bucket['hours']
     
     if not cycle_times_hours:
         logging.warning("  No valid cycle times calculated")
@@ -256,73 +398,42 @@ def calculate_cycle_time(jira_data: List[Dict[str, Any]],
             'avg_days': 0,
             'avg_hours': 0,
             'completed_count': 0,
-            'in_progress_count': len(in_progress_only),
+            'in_progress_count': bucket['in_progress'],
             'issue_types_tracked': issue_types
         }
     
-    # Calculate statistics
-    median_hours = statistics.median(cycle_times_hours)
-    median_days = median_hours / 24
-    avg_hours = statistics.mean(cycle_times_hours)
-    avg_days = avg_hours / 24
-    
-    logging.warning(f"  Median Cycle Time: {median_days:.1f} days ({median_hours:.1f} hours)")
-    logging.warning(f"  Average Cycle Time: {avg_days:.1f} days ({avg_hours:.1f} hours)")
-    logging.warning(f"  Based on {len(cycle_times_hours)} completed issues")
-    
     return {
-        'median_days': round(median_days, 1),
-        'median_hours': round(median_hours, 1),
-        'avg_days': round(avg_days, 1),
-        'avg_hours': round(avg_hours, 1),
-        'completed_count': len(cycle_times_hours),
-        'in_progress_count': len(in_progress_only),
+        **_duration_stats(cycle_times_hours, 'Cycle Time', 'issues'),
+        'in_progress_count': bucket['in_progress'],
         'issue_types_tracked': issue_types
     }
 
 
-def calculate_bug_resolution_time(jira_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_bug_resolution_time(jira_data: List[Dict[str, Any]],
+                                  durations: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
     """
     Calculate Bug Resolution Time: duration from In Progress to Done for Bug issues.
     Only includes bugs with both timestamps.
     
     Args:
         jira_data: List of Jira issue dictionaries.
+        durations: Result of _collect_jira_durations(), to share one pass over
+            jira_data with Cycle Time. Computed if omitted.
         
     Returns:
         Dictionary with median time, averages, and counts.
     """
     logging.warning("Calculating Bug Resolution Time...")
     
-    # Filter for Bug issue type
-    bug_issues = [
-        issue for issue in jira_data 
-        if issue.get('type') == 'Bug'
-    ]
-    
-    logging.warning(f"  Total Bug issues: {len(bug_issues)}")
-    
-    # Filter for bugs with both timestamps
-    bugs_with_timestamps = [
-        issue for issue in bug_issues
-        if issue.get('in_progress_timestamp') and 
-           issue.get('done_timestamp') and
-           issue.get('in_progress_timestamp').strip() and
-           issue.get('done_timestamp').strip()
-    ]
-    
-    # Count bugs still in progress (have in_progress but no done)
-    in_progress_bugs = [
-        issue for issue in bug_issues
-        if issue.get('in_progress_timestamp') and 
-           issue.get('in_progress_timestamp').strip() and
-           (not issue.get('done_timestamp') or not issue.get('done_timestamp').strip())
-    ]
-    
-    logging.warning(f"  Bugs with complete timestamps: {len(bugs_with_timestamps)}")
-    logging.warning(f"  Bugs still in progress: {len(in_progress_bugs)}")
-    
-    if not bugs_with_timestamps:
+    if durations is None:
+        durations = _collect_jira_durations(jira_data, ())
+    bucket = durations['bug']
+    
+    logging.warning(f"  Total Bug issues: {bucket['total']}")
+    logging.warning(f"  Bugs with complete timestamps: {bucket['complete']}")
+    logging.warning(f"  Bugs still in progress: {bucket['in_progress']}")
+    
+    if not bucket['complete']:
         logging.warning("  No bugs with complete timestamps for Bug Resolution Time calculation")
         return {
             'median_days': 0,
@@ -330,30 +441,11 @@ def calculate_bug_resolution_time(jira_data: List[Dict[str, Any]]) -> Dict[str,
             'avg_days': 0,
             'avg_hours': 0,
             'completed_count': 0,
-            'in_progress_count': len(in_progress_bugs)
+            'in_progress_count': bucket['in_progress']
         }
     
-    # Calculate resolution times
-    resolution_times_hours = []
-    
-    for issue in bugs_with_timestamps:
-        try:
-            # Parse timestamps
-            in_progress = datetime.strptime(issue['in_progress_timestamp'], '%Y-%m-%d %H:%M:%S')
-            done = datetime.strptime(issue['done_timestamp'], '%Y-%m-%d %H:%M:%S')
-            
-            # Calculate resolution time in hours
-            resolution_time_hours = (done - in_progress).total_seconds() / 3600
-            
-            # Skip negative times (data quality issue)
-            if resolution_time_hours >= 0:
-                resolution_times_hours.append(resolution_time_hours)
-            else:
-                logging.warning(f"  Skipping {issue.get('ticket_key')} - negative resolution time")
-            
-        except (ValueError, KeyError) as e:
-            logging.warning(f"  Skipping {issue.get('ticket_key')} due to parsing error: {e}")
-            continue
+    _log_skipped_issues(bucket, 'resolution time')
+    resolution_times_hours = bucket['hours']
     
     if not resolution_times_hours:
         logging.warning("  No valid resolution times calculated")
@@ -363,38 +455,25 @@ def calculate_bug_resolution_time(jira_data: List[Dict[str, Any]]) -> Dict[str,
             'avg_days': 0,
             'avg_hours': 0,
             'completed_count': 0,
-            'in_progress_count': len(in_progress_bugs)
+            'in_progress_count': bucket['in_progress']
         }
     
-    # Calculate statistics
-    median_hours = statistics.median(resolution_times_hours)
-    median_days = median_hours / 24
-    avg_hours = statistics.mean(resolution_times_hours)
-    avg_days = avg_hours / 24
-    
-    logging.warning(f"  Median Bug Resolution Time: {median_days:.1f} days ({median_hours:.1f} hours)")
-    logging.warning(f"  Average Bug Resolution Time: {avg_days:.1f} days ({avg_hours:.1f} hours)")
-    logging.warning(f"  Based on {len(resolution_times_hours)} completed bugs")
-    
     return {
-        'median_days': round(median_days, 1),
-        'median_hours': round(median_hours, 1),
-        'avg_days': round(avg_days, 1),
-        'avg_hours': round(avg_hours, 1),
-        'completed_count': len(resolution_times_hours),
-        'in_progress_count': len(in_progress_bugs)
+        **_duration_stats(resolution_times_hours, 'Bug Resolution Time', 'bugs'),
+        'in_progress_count': bucket['in_progress']
     }
 
 
 def calculate_all_metrics(jira_data: List[Dict[str, Any]], 
-                          github_data: List[Dict[str, Any]],
+                          github_data: Iterable[Dict[str, Any]],
                           config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate all enabled metrics based on configuration.
     
     Args:
         jira_data: List of Jira issue dictionaries.
-        github_data: List of GitHub PR dictionaries.
+        github_data: GitHub PR dictionaries. May be a one-shot iterator (e.g. rows
+            streamed from CSV); it is consumed exactly once.
         config: Configuration dictionary with metrics settings.
         
     Returns:
@@ -407,7 +486,7 @@ def calculate_all_metrics(jira_data: List[Dict[str, Any]],
         'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         'summary': {
             'total_jira_issues': len(jira_data),
-            'total_prs': len(github_data),
+            'total_prs': 0,
             'matched_prs': 0,
             'non_merged_prs': 0
         }
@@ -415,20 +494,31 @@ def calculate_all_metrics(jira_data: List[Dict[str, Any]],
     
     # Calculate Change Lead Time if enabled
     if metrics_config.get('change_lead_time', {}).get('enabled', False):
-        change_lead_time = calculate_change_lead_time(jira_data, github_data)
+        change_lead_time = calculate_change_lead_time(jira_data, github_data, build_ticket_key_set(jira_data))
         results['change_lead_time'] = change_lead_time
+        results['summary']['total_prs'] = change_lead_time['merged_pr_count'] + change_lead_time['non_merged_pr_count']
         results['summary']['matched_prs'] = change_lead_time['matched_pr_count']
         results['summary']['non_merged_prs'] = change_lead_time['non_merged_pr_count']
+    else:
+        results['summary']['total_prs'] = sum(1 for _ in github_data)
+    
+    cycle_time_enabled = metrics_config.get('cycle_time', {}).get('enabled', False)
+    bug_resolution_enabled = metrics_config.get('bug_resolution_time', {}).get('enabled', False)
+    issue_types = metrics_config.get('cycle_time', {}).get('include_issue_types', ['Story', 'Sub-task'])
+    
+    # Both Jira metrics share a single pass over the issues
+    durations = None
+    if cycle_time_enabled or bug_resolution_enabled:
+        durations = _collect_jira_durations(jira_data, issue_types if cycle_time_enabled else ())
     
     # Calculate Cycle Time if enabled
-    if metrics_config.get('cycle_time', {}).get('enabled', False):
-        issue_types = metrics_config.get('cycle_time', {}).get('include_issue_types', ['Story', 'Sub-task'])
-        cycle_time = calculate_cycle_time(jira_data, issue_types)
+    if cycle_time_enabled:
+        cycle_time = calculate_cycle_time(jira_data, issue_types, durations)
         results['cycle_time'] = cycle_time
     
     # Calculate Bug Resolution Time if enabled
-    if metrics_config.get('bug_resolution_time', {}).get('enabled', False):
-        bug_resolution_time = calculate_bug_resolution_time(jira_data)
+    if bug_resolution_enabled:
+        bug_resolution_time = calculate_bug_resolution_time(jira_data, durations)
         results['bug_resolution_time'] = bug_resolution_time
     
     return results
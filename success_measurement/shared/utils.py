@@ -2,18 +2,44 @@
 Shared utility functions for the Success Measurement project.
 """
 
+import copy
 import csv
+import json
 import logging
 import os
+import re
 import sys
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import yaml
 from dotenv import load_dotenv
 from dateutil import parser as dateutil_parser
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Prefer orjson for decoding API responses when it is installed
+try:
+    import orjson as _json_decoder
+except ImportError:
+    _json_decoder = json
+
+# .env file at the root of the success_measurement directory
+_ENV_PATH = Path(__file__).parent.parent / '.env'
+
+# Canonical ISO 8601 timestamps as sent by GitHub and Jira, e.g. 2025-10-30T15:00:10Z or
+# 2025-10-30T15:00:10.635+0100; their date and time can be sliced out without parsing
+_CANONICAL_ISO_RE = re.compile(
+    r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d'
+    r'(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?'
+)
+
 
 def setup_logging() -> None:
     """
@@ -26,6 +52,21 @@ def setup_logging() -> None:
     )
 
 
+def parse_json_response(response: Any) -> Any:
+    """
+    Decode the JSON body of an HTTP response.
+    
+    Uses orjson on the raw bytes when available, otherwise the standard library.
+    
+    Args:
+        response: requests.Response object.
+        
+    Returns:
+        Decoded JSON data.
+    """
+    return _json_decoder.loads(response.content)
+
+
 def load_env_vars() -> Dict[str, str]:
     """
     Load and validate environment variables from .env file.
@@ -36,15 +77,12 @@ def load_env_vars() -> Dict[str, str]:
     Raises:
         SystemExit: If required environment variables are missing.
     """
-    # Load .env file from the root of success_measurement directory
-    env_path = Path(__file__).parent.parent / '.env'
-    
-    if not env_path.exists():
-        logging.error(f".env file not found at {env_path}")
+    if not _ENV_PATH.exists():
+        logging.error(f".env file not found at {_ENV_PATH}")
         logging.error("Please create a .env file with required credentials.")
         sys.exit(1)
     
-    load_dotenv(dotenv_path=env_path)
+    load_dotenv(dotenv_path=_ENV_PATH)
     
     # Required environment variables
     required_vars = [
@@ -72,6 +110,13 @@ def load_env_vars() -> Dict[str, str]:
     return env_vars
 
 
+@lru_cache(maxsize=8)
+def _parse_yaml_file(config_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file. Cached per (path, mtime, size), so an unchanged file is parsed only once."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_yaml_config(config_path: str) -> Dict[str, Any]:
     """
     Parse and validate YAML configuration file.
@@ -87,13 +132,17 @@ def load_yaml_config(config_path: str) -> Dict[str, Any]:
     """
     config_file = Path(config_path)
     
-    if not config_file.exists():
+    # One stat both checks existence and identifies the file version for the parse cache
+    try:
+        stat_result = config_file.stat()
+    except OSError:
         logging.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # Copy so callers can modify their config without touching the cached parse
+        config = copy.deepcopy(_parse_yaml_file(str(config_file.resolve()), stat_result.st_mtime_ns,
+                                                stat_result.st_size))
     except yaml.YAMLError as e:
         logging.error(f"Error parsing YAML configuration: {e}")
         sys.exit(1)
@@ -113,6 +162,12 @@ def load_yaml_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
+def _row_values(rows: Iterable[Dict[str, Any]], fieldnames: List[str]) -> Iterator[List[Any]]:
+    """Turn row dictionaries into value lists in fieldnames order ('' for missing keys)."""
+    for row in rows:
+        yield [row.get(name, '') for name in fieldnames]
+
+
 def write_to_csv(data: List[Dict[str, Any]], filepath: str, fieldnames: List[str]) -> None:
     """
     Write data to CSV file with proper error handling.
@@ -130,10 +185,12 @@ def write_to_csv(data: List[Dict[str, Any]], filepath: str, fieldnames: List[str
         output_path = Path(filepath)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        # Large buffer: rows reach the disk in a few big writes, flushed once on close
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as csvfile:
+            # Plain csv.writer: DictWriter re-checks every row's keys against the fieldnames
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(_row_values(data, fieldnames))
         
         logging.warning(f"Successfully wrote {len(data)} records to {filepath}")
         
@@ -142,6 +199,104 @@ def write_to_csv(data: List[Dict[str, Any]], filepath: str, fieldnames: List[str
         sys.exit(1)
 
 
+class CSVStreamWriter:
+    """
+    Write CSV rows incrementally as they are produced.
+    
+    Rows go to a temporary file next to the target, which replaces the target only
+    when the block exits cleanly and at least one row was written. A failed or empty
+    run therefore leaves the previous CSV untouched.
+    
+    Usage:
+        with CSVStreamWriter(path, fieldnames) as writer:
+            for row in rows:
+                writer.writerow(row)
+    """
+    
+    # Rows are queued and handed to the C writer in chunks to amortize per-row call overhead
+    BATCH_SIZE = 1000
+    
+    def __init__(self, filepath: str, fieldnames: List[str]):
+        """
+        Initialize the writer.
+        
+        Args:
+            filepath: Path where CSV file should be written.
+            fieldnames: List of column names for the CSV.
+        """
+        self.filepath = Path(filepath)
+        self.fieldnames = fieldnames
+        self.count = 0
+        self._tmp_path = self.filepath.with_name(self.filepath.name + '.tmp')
+        self._file = None
+        self._writer = None
+        self._batch = []
+    
+    def __enter__(self) -> 'CSVStreamWriter':
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._tmp_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024)
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.fieldnames)
+        except (IOError, OSError) as e:
+            logging.error(f"Failed to write CSV file {self.filepath}: {e}")
+            sys.exit(1)
+        return self
+    
+    def writerow(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a single row; rows are written in batches of BATCH_SIZE.
+        
+        Args:
+            row: Dictionary containing row data.
+            
+        Raises:
+            SystemExit: If CSV writing fails.
+        """
+        self._batch.append(row)
+        self.count += 1
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush_batch()
+    
+    def _flush_batch(self) -> None:
+        """Write queued rows with a single writerows() call."""
+        try:
+            self._writer.writerows(_row_values(self._batch, self.fieldnames))
+        except (IOError, OSError) as e:
+            logging.error(f"Failed to write CSV file {self.filepath}: {e}")
+            sys.exit(1)
+        self._batch.clear()
+    
+    def writerows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write every row from an iterable (list or generator).
+        
+        Args:
+            rows: Iterable of dictionaries containing row data.
+            
+        Raises:
+            SystemExit: If CSV writing fails.
+        """
+        for row in rows:
+            self.writerow(row)
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            if exc_type is None and self._batch:
+                self._writer.writerows(_row_values(self._batch, self.fieldnames))
+            self._file.close()
+            if exc_type is None and self.count:
+                os.replace(self._tmp_path, self.filepath)
+                logging.warning(f"Successfully wrote {self.count} records to {self.filepath}")
+            else:
+                os.remove(self._tmp_path)
+        except (IOError, OSError) as e:
+            logging.error(f"Failed to write CSV file {self.filepath}: {e}")
+            if exc_type is None:
+                sys.exit(1)
+        return False
+
+
 def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[str]:
     """
     Convert ISO 8601 timestamp to human-readable format.
@@ -156,6 +311,10 @@ def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[str]:
     if not timestamp_str:
         return None
     
+    # Fast path: the output is just the date and time fields of the input (no zone conversion)
+    if isinstance(timestamp_str, str) and _CANONICAL_ISO_RE.fullmatch(timestamp_str):
+        return f"{timestamp_str[:10]} {timestamp_str[11:19]}"
+    
     try:
         # Use dateutil parser which handles various ISO 8601 formats
         # including: 2025-10-30T15:00:10.635+0100
@@ -167,6 +326,8 @@ def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[str]:
         return timestamp_str  # Return original if parsing fails
 
 
+# Pure function of its input and called several times per issue and PR, so results are cached
+@lru_cache(maxsize=65536)
 def format_timestamp_for_csv(timestamp_str: Optional[str]) -> str:
     """
     Ensure consistent human-readable timestamp format for CSV output.
@@ -238,8 +399,7 @@ def ensure_data_directory(project_path: str) -> None:
     Args:
         project_path: Path to the project directory.
     """
-    data_dir = Path(project_path) / 'data'
-    data_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.path.join(project_path, 'data'), exist_ok=True)
 
 
 def csv_exists(csv_path: str) -> bool:
@@ -259,9 +419,9 @@ def csv_exists(csv_path: str) -> bool:
     
     try:
         with open(csv_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            # Check if file has more than just header
-            return len(lines) > 1
+            # Check if file has more than just header (without reading the whole file)
+            f.readline()
+            return bool(f.readline())
     except Exception:
         return False
 
@@ -305,3 +465,26 @@ def load_csv_to_dict(csv_path: str) -> List[Dict[str, Any]]:
         logging.error(f"Failed to load CSV file {csv_path}: {e}")
         sys.exit(1)
 
+
+def iter_csv_as_dicts(csv_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a CSV file as dictionaries, one row at a time.
+    
+    Unlike load_csv_to_dict, rows are never held in memory together; callers
+    that need a single pass over the data should prefer this.
+    
+    Args:
+        csv_path: Path to CSV file.
+        
+    Yields:
+        One dictionary per CSV data row.
+        
+    Raises:
+        SystemExit: If the file cannot be read.
+    """
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+            yield from csv.DictReader(f)
+    except (IOError, OSError, csv.Error) as e:
+        logging.error(f"Failed to load CSV file {csv_path}: {e}")
+        sys.exit(1)